@@ -5,14 +5,16 @@ This module defines the classes and enums related to game actions:
 - Action: The main class representing a player's action
 - ActionType: Enum for different types of actions
 - ActionSource: Enum for where cards come from in actions
+- RANK_ACTIONS: Ways each rank can be played from hand
 """
 
 from __future__ import annotations
 
+import copy
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
-from game.card import Card
+from game.card import Card, Rank
 
 
 class ActionSource(Enum):
@@ -51,6 +53,15 @@ class Action:
         source (ActionSource): Where the card comes from.
     """
 
+    __slots__ = (
+        "action_type",
+        "card",
+        "target",
+        "played_by",
+        "requires_additional_input",
+        "source",
+    )
+
     action_type: ActionType
     card: Optional[Card]
     target: Optional[Card]
@@ -149,6 +160,29 @@ class Action:
         """
         return self.__repr__()
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Action:
+        """Copy the action, mapping its cards through ``memo``.
+
+        Deep-copying an action with the memo filled by ``GameState.clone``
+        gives an action that refers to the clone's cards.
+
+        Args:
+            memo (Dict[int, Any]): The ``copy.deepcopy`` memo.
+
+        Returns:
+            Action: The copy.
+        """
+        copied = Action(
+            self.action_type,
+            self.played_by,
+            card=copy.deepcopy(self.card, memo),
+            target=copy.deepcopy(self.target, memo),
+            requires_additional_input=self.requires_additional_input,
+            source=self.source,
+        )
+        memo[id(self)] = copied
+        return copied
+
 
 class ActionType(Enum):
     """Enumeration of possible action types in the game.
@@ -192,3 +226,23 @@ class ActionType(Enum):
     ACCEPT_STALEMATE = "Accept Stalemate"
     REJECT_STALEMATE = "Reject Stalemate"
     CONCEDE = "Concede"
+
+
+# Ways a card of each rank can be played on a turn. Counters (Twos) are only
+# offered while a one-off is resolving and are not listed here.
+RANK_ACTIONS: Dict[Rank, Tuple[ActionType, ...]] = {
+    Rank.ACE: (ActionType.POINTS, ActionType.ONE_OFF, ActionType.SCUTTLE),
+    Rank.TWO: (ActionType.POINTS, ActionType.SCUTTLE),
+    Rank.THREE: (ActionType.POINTS, ActionType.ONE_OFF, ActionType.SCUTTLE),
+    Rank.FOUR: (ActionType.POINTS, ActionType.ONE_OFF, ActionType.SCUTTLE),
+    Rank.FIVE: (ActionType.POINTS, ActionType.ONE_OFF, ActionType.SCUTTLE),
+    Rank.SIX: (ActionType.POINTS, ActionType.ONE_OFF, ActionType.SCUTTLE),
+    Rank.SEVEN: (ActionType.POINTS, ActionType.ONE_OFF, ActionType.SCUTTLE),
+    Rank.EIGHT: (ActionType.POINTS, ActionType.SCUTTLE),
+    Rank.NINE: (ActionType.POINTS, ActionType.SCUTTLE),
+    Rank.TEN: (ActionType.POINTS, ActionType.SCUTTLE),
+    Rank.JACK: (ActionType.JACK,),
+    # Only Kings and Queens are implemented as face cards for now
+    Rank.QUEEN: (ActionType.FACE_CARD,),
+    Rank.KING: (ActionType.FACE_CARD,),
+}
@@ -8,12 +8,15 @@ implements strategies, and makes decisions based on the current game state.
 
 from __future__ import annotations
 
+import asyncio
+import re
 import time
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
 import ollama
 
 from game.action import Action
+from game.ai_prompts import GAME_CONTEXT
 from game.card import Card, Purpose
 from game.game_state import GameState
 from game.utils import log_print
@@ -35,54 +38,28 @@ class AIPlayer:
     Attributes:
         model (str): The Ollama model to use for decision making.
         max_retries (int): Maximum number of retries for failed LLM calls.
-        retry_delay (int): Delay in seconds between retries.
+        retry_delay (int): Base delay in seconds between retries. get_action
+            doubles it after each failed attempt.
         GAME_CONTEXT (str): Detailed game rules and strategy guide for the LLM.
+        KEEP_ALIVE (str): How long Ollama keeps the model loaded between calls.
+        GENERATE_OPTIONS (Dict[str, Any]): Sampling options for action selection.
+            Generation is capped to a few tokens since only the action number
+            is needed.
     """
 
+    KEEP_ALIVE = "30m"
+    # Patterns used to pull the chosen index out of LLM responses
+    _CHOICE_RE = re.compile(r"Choice:\s*(\d+)")
+    _CHOICE_PAIR_RE = re.compile(r"Choice:\s*(\d+),\s*(\d+)")
+    _NUM_RE = re.compile(r"\d+")
+    GENERATE_OPTIONS: Dict[str, Any] = {
+        "num_predict": 16,
+        "stop": ["\n"],
+        "temperature": 0,
+    }
+
     # Game rules and strategy context for the LLM
-    GAME_CONTEXT = """
-You are an expert of playing competitive card games. You excel at reasoning through the rules of the card game and making optimal decisions. You are great at identifying patterns and making strategic moves. You are playing a card game called Cuttle. Here are the key rules and strategies:
-
-Rules:
-1. Win condition: Reach your point target (initial target is 21 points)
-2. Card Actions:
-    - Play as points (number cards 1-10), only Ace through Ten are counted as points. Eight played as face card is not counted as points.
-    - Play as face cards (Kings, Queens, Jacks, Eights)
-    - Play as one-off effects (Aces, Threes, Fours, Fives, Sixes)
-        - Aces clears all point cards for both players
-        - Threes let's you choose a card from the scrap pile. Avoid playing Threes as one-off when the scrap pile is empty or does not have any cards you want.
-        - Fives will let you draw the top two cards from the deck.
-        - Sixes clears all face cards for both players
-    - Scuttle: Play a higher point card to destroy opponent's point card
-    - Counter: Use a Two to counter any one-off effect
-3. Kings reduce your target score (1 King: 14, 2 Kings: 10, 3 Kings: 5, 4 Kings: 0)
-4. Face cards provide special abilities. Face cards are not counted as points.
-    - King: Reduces target score
-    - Queen: Protects your points from face cards, certain targeted one-offs, and counters. Does not protect against Ace One-offs or Six One-offs.
-    - Jack: Steals opponent's points
-    - Eight: Glasses (opponent plays with revealed hand)
-
-
-Strategies:
-1. Optimize to increase your score and decrease your target score. If you have a high value point card, try to play it as points. If a move increases your score to meet or exceed your target score, do it straight away.
-2. Prioritize playing Kings early to reduce your target score
-3. Save Twos for countering important one-off effects. Favor drawing a card over playing a two as points.
-4. Use Jacks to steal high-value point cards
-5. Protect high-value points with Queens
-6. Use Aces to clear opponent's strong point cards. Avoid playing Aces as one-off when opponent doesn't have any point cards on field. Avoid playing Aces as points when possible since the reward is low.
-7. Keep track of used Twos to know when one-offs are safe
-8. Scuttle opponent's high-value points when possible
-9. Avoid playing Six as one-off when opponent doesn't have any face cards on field.
-10. If opponent score is close to opponent's target, try to play Aces as one-off to clear their points, or play Sixes as one-off to clear their Kings if any are on field.
-
-Mistakes to avoid:
-1. Playing Aces as one-off when opponent doesn't have any point cards on field.
-2. Playing Aces as points since the reward is low.
-3. Playing Threes as one-off when the scrap pile is empty or does not have any cards you want.
-4. Playing Sixes as one-off when opponent doesn't have any face cards on field.
-
-The Strategy is key to winning the game.
-    """
+    GAME_CONTEXT = GAME_CONTEXT
 
     def __init__(self, retry_delay: int = 1, max_retries: int = 3) -> None:
         """Initialize the AI player.
@@ -95,6 +72,13 @@ The Strategy is key to winning the game.
         self.model = "gemma3:4b"  # Default to mistral model
         self.max_retries = max_retries
         self.retry_delay = retry_delay  # seconds
+        # Persistent client so HTTP connections are reused across decisions
+        self._client = ollama.AsyncClient()
+        # Sorted card indices of a discard pile -> index of the card chosen from it
+        self._discard_choice_cache: Dict[Tuple[int, ...], int] = {}
+        # Token context with GAME_CONTEXT already prefilled, shared by get_action
+        self._context: Optional[List[int]] = None
+        self._context_lock = asyncio.Lock()
 
         # Initialize system context and verify AI understanding
         self._verify_ai_understanding()
@@ -152,9 +136,10 @@ Keep your response concise."""
         opponent_face_cards = [
             card
             for card in game_state.fields[0]
-            if card.purpose == Purpose.FACE_CARD
+            if card.purpose is Purpose.FACE_CARD
         ]
 
+        scores, targets = game_state.scores_and_targets()
         legal_actions_str = "\n".join(
             [f"- action {i}: {action}" for i, action in enumerate(legal_actions)]
         )
@@ -164,16 +149,16 @@ Current Game State:
 AI
 {"AI Hand: " + str(game_state.hands[1]) if not is_human_view else "AI Hand: [Hidden]"}
 AI Field: {game_state.get_player_field(1)}
-AI Score: {game_state.get_player_score(1)}
-AI Target: {game_state.get_player_target(1)}
+AI Score: {scores[1]}
+AI Target: {targets[1]}
 
 Opponent
 Opponent's Hand Size: {len(game_state.hands[0])}
 Opponent's Field: {game_state.get_player_field(0)}
 Opponent's Point Cards: {opponent_point_cards}
 Opponent's Face Cards: {opponent_face_cards}
-Opponent's Score: {game_state.get_player_score(0)}
-Opponent's Target: {game_state.get_player_target(0)}
+Opponent's Score: {scores[0]}
+Opponent's Target: {targets[0]}
 
 Deck Size: {len(game_state.deck)}
 Discard Pile Size: {len(game_state.discard_pile)}
@@ -188,12 +173,11 @@ Instructions:
 4. Stop thinking and make a choice after a few seconds.
 5. If there is only one action, choose it without thinking.
 6. Action number should be a number from 0 to {len(legal_actions) - 1}
-6. Format your response as:
-    Reasoning: [brief explanation]
+7. Respond with the action number only, on a single line:
     Choice: [action number]
 
 Make your choice now:
-        """
+Choice:"""
         return prompt
 
     async def get_action(
@@ -223,6 +207,9 @@ Make your choice now:
         """
         if not legal_actions:
             raise ValueError("No legal actions available")
+        if len(legal_actions) == 1:
+            # Nothing to decide; skip building the prompt and the LLM round trip
+            return legal_actions[0]
 
         # Format the game state and actions into a prompt using the moved method
         prompt = self._format_game_state(game_state, legal_actions)
@@ -231,70 +218,171 @@ Make your choice now:
 
         while retries < self.max_retries:
             try:
-                # Get response from Ollama with system context
-                response = ollama.chat(
+                # The prompt ends with "Choice:", so the model only has to
+                # complete the action number and generation stops at newline.
+                # The rules are sent as a prefilled context when one is
+                # available, so only the game state has to be prefilled.
+                context = await self._game_context()
+                response = await self._client.generate(
                     model=self.model,
-                    messages=[
-                        {"role": "system", "content": self.GAME_CONTEXT},
-                        {"role": "user", "content": prompt},
-                    ],
+                    prompt=prompt,
+                    system="" if context else self.GAME_CONTEXT,
+                    context=context,
+                    options=self._retry_options(self.GENERATE_OPTIONS, retries),
+                    keep_alive=self.KEEP_ALIVE,
                 )
-
-                # Extract the action number from the response
-                response_text = "" # Default to empty string
-                if isinstance(response, dict):
-                    # Handle real response (dictionary)
-                    if 'message' in response and 'content' in response['message']:
-                        response_text = response['message']['content']
-                elif hasattr(response, 'message') and hasattr(response.message, 'content'):
-                    # Handle MagicMock response (attribute access)
-                    response_text = response.message.content
-                else:
-                    print(f"Warning: Unexpected response structure: {type(response)}")
-                    # Fallback or raise error if needed, for now rely on parsing logic below to handle empty/bad string
-
-                # log_print(f"AI Response Content: {response_text}") # Use standard print for debugging
-                print(f"AI Response Content: {response_text}")
-                # Look for "Choice: [number]" pattern first
-                import re
-
-                if response_text is not None:
-                    choice_match = re.search(r"Choice:\s*(\d+)", response_text)
-                    if choice_match:
-                        action_index = int(choice_match.group(1))
-                        if 0 <= action_index < len(legal_actions):
-                            return legal_actions[action_index]
-
-                    # Fallback: Find any number in the response
-                    all_numbers = re.findall(r"\d+", response_text)
-                    if all_numbers:
-                        action_index = int(all_numbers[-1])  # Assume last number is choice
-                        if 0 <= action_index < len(legal_actions):
-                            return legal_actions[action_index]
-
-                # If extraction fails, log error and increment retries
+                response_text = "Choice:" + self._response_text(response)
+                log_print(f"AI Response Content: {response_text}")
+
+                choice_match = self._CHOICE_RE.search(response_text)
+                if choice_match:
+                    # An out-of-range choice snaps to the nearest valid action
+                    # rather than paying for another round trip
+                    action_index = int(choice_match.group(1))
+                    return legal_actions[min(action_index, len(legal_actions) - 1)]
+
+                # Fallback: Find any number in the response
+                all_numbers = self._NUM_RE.findall(response_text)
+                if all_numbers:
+                    action_index = int(all_numbers[-1])  # Assume last number is choice
+                    if 0 <= action_index < len(legal_actions):
+                        return legal_actions[action_index]
+
+                # If extraction fails, log error and retry
                 log_print(
                     f"Error: Could not extract action number from response: {response_text}"
                 )
                 last_error = f"Failed to extract action number from response: {response_text}"
-                retries += 1
-                time.sleep(self.retry_delay)
 
             except Exception as e:
                 log_print(f"Error during AI action selection: {e}")
                 last_error = str(e)  # Store the error message
-                retries += 1
-                time.sleep(self.retry_delay)
+
+            retries += 1
+            if retries < self.max_retries:
+                # Back off exponentially without blocking other games on the loop
+                await asyncio.sleep(self.retry_delay * 2 ** (retries - 1))
 
         print(f"AI failed to choose an action after {self.max_retries} retries. Error: {last_error}")
+        # The cached context may be what is failing; rebuild it next time
+        self._context = None
         return legal_actions[0]
 
+    async def _game_context(self) -> Optional[List[int]]:
+        """Get the token context of a conversation that holds only the game rules.
+
+        The context is built with one short generate call the first time it is
+        needed and reused afterwards. Passing it to later calls lets Ollama
+        skip prefilling GAME_CONTEXT again. Every call starts from the same
+        context, so earlier decisions never accumulate in it.
+
+        Returns:
+            Optional[List[int]]: The context tokens, or None if the server does
+                not return any.
+        """
+        async with self._context_lock:
+            if self._context is None:
+                response = await self._client.generate(
+                    model=self.model,
+                    prompt="Reply OK if you understand the rules.",
+                    system=self.GAME_CONTEXT,
+                    options={"num_predict": 1, "temperature": 0},
+                    keep_alive=self.KEEP_ALIVE,
+                )
+                if isinstance(response, dict):
+                    context = response.get("context")
+                else:
+                    context = getattr(response, "context", None)
+                # An empty list records that the server returned no context
+                self._context = list(context) if context else []
+            return self._context or None
+
+    async def get_actions_batch(
+        self,
+        game_states: List[GameState],
+        legal_actions_list: List[List[Action]],
+    ) -> List[Action]:
+        """Choose actions for several game states concurrently.
+
+        All prompts are issued at once so an Ollama server started with
+        ``--parallel`` can schedule them into the same forward passes instead
+        of serving the decisions one after another.
+
+        Args:
+            game_states (List[GameState]): The game states to decide for.
+            legal_actions_list (List[List[Action]]): Legal actions for each state,
+                in the same order as ``game_states``.
+
+        Returns:
+            List[Action]: The chosen action for each game state.
+
+        Raises:
+            ValueError: If the two lists differ in length or any state has no
+                legal actions.
+        """
+        if len(game_states) != len(legal_actions_list):
+            raise ValueError("game_states and legal_actions_list must be the same length")
+        return list(
+            await asyncio.gather(
+                *(
+                    self.get_action(game_state, legal_actions)
+                    for game_state, legal_actions in zip(game_states, legal_actions_list)
+                )
+            )
+        )
+
+    @staticmethod
+    def _retry_options(options: Dict[str, Any], retries: int) -> Dict[str, Any]:
+        """Get sampling options for an attempt, varied on retries.
+
+        A retry with the same prompt and deterministic sampling would usually
+        repeat the same unparseable answer, so retries raise the temperature
+        and use a different seed.
+
+        Args:
+            options (Dict[str, Any]): Options for the first attempt.
+            retries (int): Number of failed attempts so far.
+
+        Returns:
+            Dict[str, Any]: Options to send with this attempt.
+        """
+        if retries == 0:
+            return options
+        return {**options, "temperature": 0.3 + 0.2 * retries, "seed": retries}
+
+    @staticmethod
+    def _response_text(response: Any) -> str:
+        """Extract the generated text from an Ollama generate response.
+
+        Args:
+            response: A ``GenerateResponse`` or its dictionary form.
+
+        Returns:
+            str: The generated text, or an empty string if none is present.
+        """
+        if isinstance(response, dict):
+            return response.get("response") or ""
+        return getattr(response, "response", None) or ""
+
     def set_model(self, model: str) -> None:
         """Set the language model used by the AI player."""
         self.model = model
+        # Context tokens belong to the model that produced them
+        self._context = None
 
     def choose_card_from_discard(self, discard_pile: List[Card]) -> Card:
-        """Choose a card from the discard pile when playing a Three."""
+        """Choose a card from the discard pile when playing a Three.
+
+        Choices are remembered per discard pile contents, so a pile the AI has
+        already chosen from is answered without another LLM call.
+        """
+        cache_key = tuple(sorted(card.index for card in discard_pile))
+        cached_index = self._discard_choice_cache.get(cache_key)
+        if cached_index is not None:
+            for card in discard_pile:
+                if card.index == cached_index:
+                    return card
+
         # Format the prompt for the LLM
         prompt = f"""
         You need to choose a card from the discard pile. Here are the available cards:
@@ -329,26 +417,29 @@ Make your choice now:
                         {"role": "system", "content": self.GAME_CONTEXT},
                         {"role": "user", "content": prompt},
                     ],
+                    options=self._retry_options({}, retries),
+                    keep_alive=self.KEEP_ALIVE,
                 )
 
                 # Extract the chosen card index from the response
                 response_text = response.message.content
                 log_print(f"AI Response (Choose Card): {response_text}")
-                import re
-
                 if response_text is not None:
-                    choice_match = re.search(r"Choice:\s*(\d+)", response_text)
+                    choice_match = self._CHOICE_RE.search(response_text)
                     if choice_match:
-                        card_index = int(choice_match.group(1))
-                        if 0 <= card_index < len(discard_pile):
-                            return discard_pile[card_index]
+                        card_index = min(int(choice_match.group(1)), len(discard_pile) - 1)
+                        chosen_card = discard_pile[card_index]
+                        self._discard_choice_cache[cache_key] = chosen_card.index
+                        return chosen_card
 
                     # Fallback: Find any number in the response
-                    all_numbers = re.findall(r"\d+", response_text)
+                    all_numbers = self._NUM_RE.findall(response_text)
                     if all_numbers:
                         card_index = int(all_numbers[-1])
                         if 0 <= card_index < len(discard_pile):
-                            return discard_pile[card_index]
+                            chosen_card = discard_pile[card_index]
+                            self._discard_choice_cache[cache_key] = chosen_card.index
+                            return chosen_card
                 log_print(
                     f"Error: Could not extract card choice from response: {response_text}"
                 )
@@ -406,24 +497,22 @@ Make your choice now:
                         {"role": "system", "content": self.GAME_CONTEXT},
                         {"role": "user", "content": prompt},
                     ],
+                    options=self._retry_options({}, retries),
+                    keep_alive=self.KEEP_ALIVE,
                 )
 
                 # Extract the card indices from the response
                 response_text = response.message.content
                 log_print(f"AI Response (Choose Two Cards): {response_text}")
-                import re
-
                 if response_text is not None:
-                    choice_match = re.search(
-                        r"Choice:\s*(\d+),\s*(\d+)", response_text
-                    )
+                    choice_match = self._CHOICE_PAIR_RE.search(response_text)
                     if choice_match:
                         indices = [int(choice_match.group(1)), int(choice_match.group(2))]
                         if all(0 <= i < len(hand) for i in indices) and len(set(indices)) == 2:
                             return [hand[i] for i in indices]
 
                     # Fallback: Find all numbers and take the last two distinct ones
-                    all_numbers = re.findall(r"\d+", response_text)
+                    all_numbers = self._NUM_RE.findall(response_text)
                     valid_indices = [
                         int(n) for n in all_numbers if 0 <= int(n) < len(hand)
                     ]
@@ -437,6 +526,8 @@ Make your choice now:
                     f"Error: Could not extract two card choices from response: {response_text}"
                 )
                 last_error = f"Failed to extract two card choices from response: {response_text}"
+                retries += 1
+                time.sleep(self.retry_delay)
 
             except Exception as e:
                 log_print(f"Error during AI card choice (hand): {e}")
@@ -10,8 +10,21 @@ This module defines the core card-related classes and enums used in the game:
 
 from __future__ import annotations
 
+import copy
+import random
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# Number of zones a card can be hashed in (see GameState.zobrist_hash)
+ZOBRIST_ZONE_COUNT = 16
+
+# Random 64-bit key per (card, zone), indexed by Card.index.
+# Seeded so hashes are reproducible between runs.
+_zobrist_random = random.Random(0xC077)
+_ZOBRIST = [
+    [_zobrist_random.getrandbits(64) for _ in range(ZOBRIST_ZONE_COUNT)]
+    for _ in range(52)
+]
 
 
 class Card:
@@ -24,11 +37,15 @@ class Card:
         id (str): Unique identifier for the card.
         suit (Suit): The card's suit (Clubs, Diamonds, Hearts, Spades).
         rank (Rank): The card's rank (Ace through King).
+        index (int): Position of the card in the 52-card universe,
+            ``(rank - 1) * 4 + suit``. Used to index precomputed card tables.
         played_by (Optional[int]): Index of the player who played this card (0 or 1).
         purpose (Optional[Purpose]): Current purpose of the card in the game.
         attachments (List[Card]): List of cards attached to this card (e.g., by Jacks).
     """
 
+    __slots__ = ("id", "suit", "rank", "index", "played_by", "purpose", "attachments")
+
     def __init__(
         self,
         id: str,
@@ -51,6 +68,7 @@ class Card:
         self.id = id
         self.suit = suit
         self.rank = rank
+        self.index = (rank.value[1] - 1) * 4 + suit.value[1]
         self.played_by = played_by
         self.purpose = purpose
         self.attachments = attachments if attachments is not None else list()
@@ -66,13 +84,12 @@ class Card:
         Returns:
             str: String representation of the card.
         """
-        jack_prefix = (
-            "[Jack]" * len(self.attachments) + " " if len(self.attachments) > 0 else ""
-        )
+        name = CARD_NAMES[self.index]
+        if not self.attachments:
+            return name
+        jack_prefix = "[Jack]" * len(self.attachments) + " "
         stolen_prefix = "[Stolen from opponent] " if self.is_stolen() else ""
-        return (
-            f"{stolen_prefix}{jack_prefix}{self.rank.value[0]} of {self.suit.value[0]}"
-        )
+        return f"{stolen_prefix}{jack_prefix}{name}"
 
     def __repr__(self) -> str:
         """Get a string representation of the card for debugging.
@@ -82,6 +99,32 @@ class Card:
         """
         return self.__str__()
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Card:
+        """Copy the card and the cards attached to it.
+
+        Copies the slots directly instead of going through the generic
+        ``__reduce_ex__`` path. Attachments already copied (as recorded in
+        ``memo``) are reused, so shared references stay shared.
+
+        Args:
+            memo (Dict[int, Any]): The ``copy.deepcopy`` memo.
+
+        Returns:
+            Card: The copy.
+        """
+        copied = Card.__new__(Card)
+        memo[id(self)] = copied
+        copied.id = self.id
+        copied.suit = self.suit
+        copied.rank = self.rank
+        copied.index = self.index
+        copied.played_by = self.played_by
+        copied.purpose = self.purpose
+        copied.attachments = [
+            copy.deepcopy(attachment, memo) for attachment in self.attachments
+        ]
+        return copied
+
     def clear_player_info(self) -> None:
         """Clear the card's player-specific information.
 
@@ -100,7 +143,8 @@ class Card:
         Returns:
             bool: True if the card can be played for points.
         """
-        return self.point_value() <= Rank.TEN.value[1]
+        # Cards are indexed by rank first, so every point card sorts before Jacks
+        return self.index < JACK_INDEX
 
     def point_value(self) -> int:
         """Get the card's point value.
@@ -129,6 +173,21 @@ class Card:
         """
         return self.suit.value[1]
 
+    def beats(self, other: Card) -> bool:
+        """Check if this card ranks above another card for scuttling.
+
+        A card beats another if it has a higher point value, or the same point
+        value and a higher suit. Card.index orders cards by rank and then suit,
+        so this is a single integer comparison.
+
+        Args:
+            other (Card): The card to compare against.
+
+        Returns:
+            bool: True if this card beats the other card.
+        """
+        return self.index > other.index
+
     def is_face_card(self) -> bool:
         """Check if the card is a face card.
 
@@ -141,10 +200,7 @@ class Card:
         Returns:
             bool: True if the card is a face card.
         """
-        return (
-            self.point_value() >= Rank.JACK.value[1]
-            or self.point_value() == Rank.EIGHT.value[1]
-        )
+        return self.index >= JACK_INDEX or self.rank is Rank.EIGHT
 
     def is_one_off(self) -> bool:
         """Check if the card can be played as a one-off effect.
@@ -179,6 +235,17 @@ class Card:
         """
         return len(self.attachments) % 2 == 1
 
+    def zobrist_key(self, zone: int) -> int:
+        """Get the Zobrist key for this card lying in a given zone.
+
+        Args:
+            zone (int): Zone tag in ``range(ZOBRIST_ZONE_COUNT)``.
+
+        Returns:
+            int: A random 64-bit key unique to the card's rank, suit and zone.
+        """
+        return _ZOBRIST[self.index][zone]
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the Card object to a dictionary."""
         return {
@@ -279,3 +346,19 @@ class Purpose(Enum):
     COUNTER = "Counter"
     JACK = "Jack"
     SCUTTLE = "Scuttle"
+
+
+# Card.index of the Jack of Clubs; every lower index is an Ace through Ten
+JACK_INDEX = (Rank.JACK.value[1] - 1) * len(Suit)
+
+# Point value of each card by Card.index; 0 for cards that cannot score points
+POINT_VALUE_TABLE: Tuple[int, ...] = tuple(
+    rank.value[1] if rank.value[1] <= Rank.TEN.value[1] else 0
+    for rank in Rank
+    for _ in Suit
+)
+
+# Display name of each card by Card.index, e.g. "Ace of Clubs"
+CARD_NAMES: Tuple[str, ...] = tuple(
+    f"{rank.value[0]} of {suit.value[0]}" for rank in Rank for suit in Suit
+)
@@ -13,8 +13,9 @@ import os
 import random
 import sys
 import time
-import uuid
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 from game.card import Card, Rank, Suit
 from game.game_state import GameState
@@ -24,6 +25,13 @@ from game.serializer import load_game_state, save_game_state
 if TYPE_CHECKING:
     from game.ai_player import AIPlayer
 
+# (id, suit, rank) of every card in the deck, in generate_all_cards order
+CARD_TEMPLATES: Tuple[Tuple[str, Suit, Rank], ...] = tuple(
+    (str((rank.value[1] - 1) * 4 + suit.value[1]), suit, rank)
+    for suit in Suit
+    for rank in Rank
+)
+
 
 class Game:
     """A class that represents a game of Cuttle.
@@ -53,6 +61,7 @@ class Game:
         logger: Callable[..., Any] = print,
         ai_player: Optional["AIPlayer"] = None,
         input_mode: str = "terminal",
+        rng: Optional[Union[int, np.random.Generator]] = None,
     ):
         """Initialize a new game of Cuttle.
 
@@ -65,10 +74,17 @@ class Game:
                 Defaults to None.
             logger (callable, optional): Function to use for logging. Defaults to print.
             ai_player (Optional["AIPlayer"], optional): AI player instance. Defaults to None.
+            rng (Optional[Union[int, np.random.Generator]], optional): Seed or
+                generator for shuffling and random card picks. Defaults to None,
+                which seeds a generator from the ``random`` module so that
+                ``random.seed`` keeps deals reproducible.
         """
         self.players = [0, 1]
         self.logger = logger
         self.input_mode = input_mode
+        if rng is None:
+            rng = random.getrandbits(64)
+        self._rng = np.random.default_rng(rng)
 
         # Create save directory if it doesn't exist
         os.makedirs(self.SAVE_DIR, exist_ok=True)
@@ -205,7 +221,7 @@ class Game:
 
         # Create deck from remaining cards
         deck = list(available_cards.values())
-        random.shuffle(deck)
+        self._rng.shuffle(deck)
         print(f"len deck: {len(deck)}")
 
         # Initialize game state with empty fields for both players
@@ -254,7 +270,7 @@ class Game:
             time.sleep(0.05)  # Add small delay to prevent log spam
             if not cards:  # Check if we have any cards left
                 raise ValueError("No cards left to fill hands")
-            card = random.choice(cards)
+            card = cards[self._rng.integers(len(cards))]
             hands[0].append(card)
             del available_cards[card.id]
             cards.remove(card)
@@ -265,7 +281,7 @@ class Game:
             time.sleep(0.05)  # Add small delay to prevent log spam
             if not cards:  # Check if we have any cards left
                 raise ValueError("No cards left to fill hands")
-            card = random.choice(cards)
+            card = cards[self._rng.integers(len(cards))]
             hands[1].append(card)
             del available_cards[card.id]
             cards.remove(card)
@@ -275,19 +291,11 @@ class Game:
         """Generate a complete deck of cards without shuffling.
 
         Returns:
-            List[Card]: A list of all possible cards in the game,
-                each with a unique UUID.
+            List[Card]: A list of all possible cards in the game. Each card's id
+                is its canonical index (see ``Card.index``), which is unique
+                within a game.
         """
-        cards = []
-        for suit in Suit.__members__.values():
-            for rank in Rank.__members__.values():
-                cards.append(
-                    Card(
-                        str(uuid.uuid4()),
-                        suit=suit,
-                        rank=rank,
-                    )
-                )
+        cards = [Card(card_id, suit, rank) for card_id, suit, rank in CARD_TEMPLATES]
         print(f"len generate all cards: {len(cards)}")
         return cards
 
@@ -297,9 +305,12 @@ class Game:
         Returns:
             List[Card]: A randomly shuffled complete deck of cards.
         """
-        cards = self.generate_all_cards()
-        random.shuffle(cards)
-        return cards
+        # Cards carry per-game state (owner, purpose, attachments), so every
+        # game gets fresh instances; only the order comes from the permutation
+        return [
+            Card(*CARD_TEMPLATES[i])
+            for i in self._rng.permutation(len(CARD_TEMPLATES)).tolist()
+        ]
 
     def deal_cards(self, deck: List[Card]) -> List[List[Card]]:
         """Deal initial cards to players.
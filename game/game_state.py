@@ -11,8 +11,8 @@ from __future__ import annotations
 from typing import (TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple,
                     cast)
 
-from game.action import Action, ActionSource, ActionType
-from game.card import Card, Purpose, Rank
+from game.action import RANK_ACTIONS, Action, ActionSource, ActionType
+from game.card import POINT_VALUE_TABLE, Card, Purpose, Rank
 from game.game_history import GameHistory
 from game.utils import log_print
 
@@ -20,6 +20,41 @@ from game.utils import log_print
 if TYPE_CHECKING:
     from game.ai_player import AIPlayer
 
+# Zone tags for Zobrist hashing; per-player zones are offset by the player index
+_ZONE_DECK = 0
+_ZONE_DISCARD = 1
+_ZONE_ATTACHED = 2
+_ZONE_COUNTER_TARGET = 3
+_ZONE_REVEALED = 4
+_ZONE_HAND = 5
+_ZONE_POINTS = 7
+_ZONE_STOLEN = 9
+_ZONE_FACE = 11
+
+_HASH_MASK = (1 << 64) - 1
+
+# Drawing never refers to a card, so every call hands out the same action
+_DRAW_ACTIONS = (Action(ActionType.DRAW, 0), Action(ActionType.DRAW, 1))
+
+# Target score indexed by the number of Kings on a player's field
+_KING_TARGETS = (21, 14, 10, 5, 0)
+
+
+def _remove_card(cards: List[Card], card: Card) -> bool:
+    """Remove ``card`` from ``cards`` if present, scanning the list once.
+
+    Cards compare by identity, so this never removes a different card of the
+    same rank and suit.
+
+    Returns:
+        bool: True if the card was found and removed.
+    """
+    try:
+        cards.remove(card)
+    except ValueError:
+        return False
+    return True
+
 
 class GameState:
     """A class that represents the state of a Cuttle game.
@@ -60,13 +95,47 @@ class GameState:
         input_mode (str): "terminal" for interactive input or "api" for external input.
         overall_turn (int): The total number of turns played.
         game_history (GameHistory): Chronological record of all game actions.
+        VERBOSE (bool): Class-wide switch for printing win and effect diagnostics.
     """
 
+    __slots__ = (
+        "hands",
+        "fields",
+        "deck",
+        "discard_pile",
+        "turn",
+        "current_action_player",
+        "status",
+        "resolving_two",
+        "resolving_one_off",
+        "resolving_three",
+        "pending_three_player",
+        "resolving_seven",
+        "pending_seven_player",
+        "pending_seven_cards",
+        "pending_seven_requires_discard",
+        "resolving_four",
+        "pending_four_player",
+        "pending_four_count",
+        "one_off_card_to_counter",
+        "logger",
+        "use_ai",
+        "ai_player",
+        "input_mode",
+        "overall_turn",
+        "last_action_played_by",
+        "game_history",
+        "_action_pool",
+    )
+
+    # Print win and effect diagnostics to stdout; off for batch play and search
+    VERBOSE = False
+
     use_ai: bool
     ai_player: Optional["AIPlayer"]
-    one_off_card_to_counter: Optional[Card] = None
-    status: Optional[str] = None
-    last_action_played_by: Optional[int] = None
+    one_off_card_to_counter: Optional[Card]
+    status: Optional[str]
+    last_action_played_by: Optional[int]
 
     def __init__(
         self,
@@ -118,6 +187,8 @@ class GameState:
         self.overall_turn = 0
         self.last_action_played_by = None
         self.game_history = GameHistory()
+        # (action type, card, player) -> Action reused across get_legal_actions calls
+        self._action_pool: Dict[Tuple[ActionType, Card, int], Action] = {}
 
     def next_turn(self) -> None:
         """Advance to the next player's turn.
@@ -127,8 +198,10 @@ class GameState:
         2. Updates the current action player
         3. Increments the overall turn counter if returning to player 0
         4. Increments the game history turn counter
+
+        Cuttle is a two-player game, so the turn simply toggles between 0 and 1.
         """
-        self.turn = (self.turn + 1) % len(self.hands)
+        self.turn ^= 1
         self.current_action_player = self.turn
         if self.turn == 0:
             self.overall_turn += 1
@@ -140,7 +213,7 @@ class GameState:
         Used during card effect resolution when multiple players
         need to take actions (e.g., countering one-off effects).
         """
-        self.current_action_player = (self.current_action_player + 1) % len(self.hands)
+        self.current_action_player ^= 1
 
     def is_game_over(self) -> bool:
         """Check if the game is over.
@@ -163,14 +236,14 @@ class GameState:
         Returns:
             List[Card]: List of cards that count towards the player's score.
         """
-        point_cards = []
-        player_field = self.fields[player]
-        for card in player_field:
-            if card.purpose == Purpose.POINTS and not card.is_stolen():
-                point_cards.append(card)
+        point_cards = [
+            card
+            for card in self.fields[player]
+            if card.purpose is Purpose.POINTS and not card.is_stolen()
+        ]
         opponent = (player + 1) % len(self.hands)
         for card in self.fields[opponent]:
-            if card.purpose == Purpose.POINTS and card.is_stolen():
+            if card.purpose is Purpose.POINTS and card.is_stolen():
                 point_cards.append(card)
         return point_cards
 
@@ -183,7 +256,16 @@ class GameState:
         Returns:
             int: The sum of all point values from the player's point cards.
         """
-        return sum([card.point_value() for card in self.player_point_cards(player)])
+        # Same cards as player_point_cards, summed without building the list
+        score = 0
+        for card in self.fields[player]:
+            if card.purpose is Purpose.POINTS and not card.is_stolen():
+                score += POINT_VALUE_TABLE[card.index]
+        opponent = (player + 1) % len(self.hands)
+        for card in self.fields[opponent]:
+            if card.purpose is Purpose.POINTS and card.is_stolen():
+                score += POINT_VALUE_TABLE[card.index]
+        return score
 
     def get_player_field(self, player: int) -> List[Card]:
         """Get all cards that are effectively on a player's field.
@@ -199,23 +281,24 @@ class GameState:
         Returns:
             List[Card]: List of cards effectively on the player's field.
         """
+        # One pass over the player's field; non-point cards are listed first
         field = []
+        own_points = []
         for card in self.fields[player]:
-            if card.purpose != Purpose.POINTS:
-                field.append(card)
-
-        for card in self.fields[player]:
-            if card.purpose == Purpose.POINTS and not card.is_stolen():
+            if card.purpose is not Purpose.POINTS:
                 field.append(card)
+            elif not card.is_stolen():
+                own_points.append(card)
+        field += own_points
 
         opponent = (player + 1) % len(self.hands)
         for card in self.fields[opponent]:
-            if card.purpose == Purpose.POINTS and card.is_stolen():
+            if card.purpose is Purpose.POINTS and card.is_stolen():
                 field.append(card)
         return field
 
     def _is_point_controlled_by(self, player: int, card: Card) -> bool:
-        if card.purpose != Purpose.POINTS:
+        if card.purpose is not Purpose.POINTS:
             return False
         if card in self.fields[player]:
             return not card.is_stolen()
@@ -240,19 +323,11 @@ class GameState:
         Returns:
             int: The target score needed to win.
         """
-        kings = [card for card in self.fields[player] if card.rank == Rank.KING]
-        num_kings = len(kings)
-
-        if num_kings == 0:
-            return 21
-        elif num_kings == 1:
-            return 14
-        elif num_kings == 2:
-            return 10
-        elif num_kings == 3:
-            return 5
-        else:
-            return 0
+        num_kings = 0
+        for card in self.fields[player]:
+            if card.rank is Rank.KING:
+                num_kings += 1
+        return _KING_TARGETS[min(num_kings, 4)]
 
     def is_winner(self, player: int) -> bool:
         """Check if a player has won the game.
@@ -267,6 +342,29 @@ class GameState:
         """
         return self.get_player_score(player) >= self.get_player_target(player)
 
+    def scores_and_targets(self) -> Tuple[List[int], List[int]]:
+        """Calculate every player's score and target in one pass over the fields.
+
+        Equivalent to calling get_player_score and get_player_target for each
+        player, but reads each field card only once.
+
+        Returns:
+            Tuple[List[int], List[int]]: Scores and targets indexed by player.
+        """
+        num_players = len(self.hands)
+        scores = [0] * num_players
+        kings = [0] * num_players
+        for player, field in enumerate(self.fields):
+            for card in field:
+                if card.purpose is Purpose.POINTS:
+                    # Stolen points count for the player holding the Jack
+                    owner = (player + 1) % num_players if card.is_stolen() else player
+                    scores[owner] += POINT_VALUE_TABLE[card.index]
+                if card.rank is Rank.KING:
+                    kings[player] += 1
+        targets = [_KING_TARGETS[min(count, 4)] for count in kings]
+        return scores, targets
+
     def winner(self) -> Optional[int]:
         """Get the winning player if the game is over.
 
@@ -274,8 +372,9 @@ class GameState:
             Optional[int]: The winning player's index (0 or 1),
                 or None if the game isn't over.
         """
-        for player in range(len(self.hands)):
-            if self.is_winner(player):
+        scores, targets = self.scores_and_targets()
+        for player, score in enumerate(scores):
+            if score >= targets[player]:
                 return player
         return None
 
@@ -289,8 +388,8 @@ class GameState:
         Returns:
             bool: True if the game is in stalemate, False otherwise.
         """
-        # Remove debug print statement that was causing infinite loop
-        return self.deck == [] and not self.winner()
+        # Only look for a winner once the deck is empty
+        return not self.deck and self.winner() is None
 
     def _move_card_to_discard(self, card: Card) -> None:
         """Move a card to the discard pile along with all its attachments.
@@ -303,6 +402,8 @@ class GameState:
         for attached_card in card.attachments:
             attached_card.clear_player_info()
             self.discard_pile.append(attached_card)
+        # Detach the Jacks so the card is not treated as stolen if it is reused
+        card.attachments.clear()
 
     def _clear_seven_state(self) -> None:
         self.resolving_seven = False
@@ -312,52 +413,41 @@ class GameState:
 
     def _actions_for_seven_card(self, card: Card, player: int) -> List[Action]:
         actions: List[Action] = []
-        if card.point_value() <= Rank.TEN.value[1]:
+        action_types = RANK_ACTIONS[card.rank]
+        if ActionType.POINTS in action_types:
             actions.append(
                 Action(ActionType.POINTS, player, card=card, source=ActionSource.DECK)
             )
 
-        if card.is_face_card() and card.rank in [Rank.KING, Rank.QUEEN]:
+        if ActionType.FACE_CARD in action_types:
             actions.append(
                 Action(ActionType.FACE_CARD, player, card=card, source=ActionSource.DECK)
             )
 
         opponent = (player + 1) % len(self.hands)
         queen_on_opponent_field = any(
-            field_card.rank == Rank.QUEEN for field_card in self.fields[opponent]
+            field_card.rank is Rank.QUEEN for field_card in self.fields[opponent]
         )
-        if card.rank == Rank.JACK and not queen_on_opponent_field:
-            for opponent_card in self.get_player_field(opponent):
-                if opponent_card.purpose == Purpose.POINTS:
-                    actions.append(
-                        Action(
-                            ActionType.JACK,
-                            player,
-                            card=card,
-                            target=opponent_card,
-                            source=ActionSource.DECK,
-                        )
+        if ActionType.JACK in action_types and not queen_on_opponent_field:
+            for opponent_card in self.player_point_cards(opponent):
+                actions.append(
+                    Action(
+                        ActionType.JACK,
+                        player,
+                        card=card,
+                        target=opponent_card,
+                        source=ActionSource.DECK,
                     )
+                )
 
-        if card.is_one_off():
+        if ActionType.ONE_OFF in action_types:
             actions.append(
                 Action(ActionType.ONE_OFF, player, card=card, source=ActionSource.DECK)
             )
 
-        if card.point_value() <= Rank.TEN.value[1]:
-            opponent_points = []
-            for field_card in self.fields[opponent]:
-                if self._is_point_controlled_by(opponent, field_card):
-                    opponent_points.append(field_card)
-            for field_card in self.fields[player]:
-                if self._is_point_controlled_by(opponent, field_card):
-                    opponent_points.append(field_card)
-
-            for opponent_card in opponent_points:
-                if card.point_value() > opponent_card.point_value() or (
-                    card.point_value() == opponent_card.point_value()
-                    and card.suit_value() > opponent_card.suit_value()
-                ):
+        if ActionType.SCUTTLE in action_types:
+            for opponent_card in self.player_point_cards(opponent):
+                if card.beats(opponent_card):
                     actions.append(
                         Action(
                             ActionType.SCUTTLE,
@@ -438,6 +528,7 @@ class GameState:
         turn_finished = False
         should_stop = False
         winner = None
+        action_type = action.action_type
 
         if self.resolving_seven:
             if action.card is None or action.card not in self.pending_seven_cards:
@@ -446,65 +537,63 @@ class GameState:
             player = self.pending_seven_player
             if player is None:
                 player = action.played_by
-            if action.action_type == ActionType.DISCARD_REVEALED:
-                if action.card in self.deck:
-                    self.deck.remove(action.card)
+            if action_type == ActionType.DISCARD_REVEALED:
+                _remove_card(self.deck, action.card)
                 self._move_card_to_discard(action.card)
                 self._clear_seven_state()
                 turn_finished = True
                 return turn_finished, should_stop, winner
 
-            if action.card in self.deck:
-                self.deck.remove(action.card)
+            _remove_card(self.deck, action.card)
             if action.card not in self.hands[player]:
                 self.hands[player].append(action.card)
             self._clear_seven_state()
 
-            if action.action_type == ActionType.POINTS:
+            if action_type == ActionType.POINTS:
                 won = self.play_points(action.card)
                 turn_finished = True
                 if won:
                     should_stop = True
-                    winner = self.winner()
+                    winner = self.turn
                 return turn_finished, should_stop, winner
-            if action.action_type == ActionType.FACE_CARD:
+            if action_type == ActionType.FACE_CARD:
                 won = self.play_face_card(action.card, action.target)
                 turn_finished = True
                 if won:
                     should_stop = True
-                    winner = self.winner()
+                    winner = self.turn
                 return turn_finished, should_stop, winner
-            if action.action_type == ActionType.JACK:
+            if action_type == ActionType.JACK:
                 won = self.play_face_card(action.card, action.target)
                 turn_finished = True
                 if won:
                     should_stop = True
-                    winner = self.winner()
+                    winner = self.turn
                 return turn_finished, should_stop, winner
-            if action.action_type == ActionType.SCUTTLE:
+            if action_type == ActionType.SCUTTLE:
                 if action.target is None:
                     log_print("Error: SCUTTLE action called without target.")
                     return True, True, None
                 self.scuttle(action.card, action.target)
                 turn_finished = True
                 return turn_finished, should_stop, winner
-            if action.action_type == ActionType.ONE_OFF:
+            if action_type == ActionType.ONE_OFF:
                 turn_finished, played_by = self.play_one_off(
                     player, action.card, None, None
                 )
                 if turn_finished:
-                    winner = self.winner()
+                    winner = self._turn_winner()
                     should_stop = winner is not None
                     return turn_finished, should_stop, winner
                 self.resolving_one_off = True
                 self.one_off_card_to_counter = action.card
                 return turn_finished, should_stop, winner
 
-        if action.action_type == ActionType.DRAW:
+        if action_type == ActionType.DRAW:
             self.draw_card()
             turn_finished = True
             return turn_finished, should_stop, winner
-        elif action.action_type == ActionType.DISCARD_FROM_HAND:
+        elif action_type == ActionType.DISCARD_FROM_HAND:
             if action.card is None:
                 log_print("Error: DISCARD_FROM_HAND action called without a card.")
                 return True, True, None
@@ -529,7 +618,7 @@ class GameState:
             else:
                 turn_finished = False
             return turn_finished, should_stop, winner
-        elif action.action_type == ActionType.TAKE_FROM_DISCARD:
+        elif action_type == ActionType.TAKE_FROM_DISCARD:
             if action.card is None:
                 log_print("Error: TAKE_FROM_DISCARD action called without a card.")
                 return True, True, None
@@ -551,37 +640,36 @@ class GameState:
             self.pending_three_player = None
             turn_finished = True
             return turn_finished, should_stop, winner
-        elif action.action_type == ActionType.POINTS:
+        elif action_type == ActionType.POINTS:
             if action.card is not None:
                 won = self.play_points(action.card)
                 turn_finished = True
                 if won:
                     should_stop = True
-                    winner = self.winner()
+                    winner = self.turn
                     return turn_finished, should_stop, winner
             else:
                 # Handle error: POINTS action requires a card
                 log_print("Error: POINTS action called without a card.")
                 return True, True, None # Stop game on error
-        elif action.action_type == ActionType.SCUTTLE:
+        elif action_type == ActionType.SCUTTLE:
             if action.card is not None and action.target is not None:
                 self.scuttle(action.card, action.target)
                 turn_finished = True
                 should_stop = False  # scuttle doesn't end the game
-                winner = self.winner()
                 return turn_finished, should_stop, winner
             else:
                 # Handle error: SCUTTLE action requires card and target
                 log_print("Error: SCUTTLE action called without card or target.")
                 return True, True, None # Stop game on error
-        elif action.action_type == ActionType.ONE_OFF:
+        elif action_type == ActionType.ONE_OFF:
             if action.card is not None:
                 # Normal one-off handling for all cards
                 turn_finished, played_by = self.play_one_off(
                     self.turn, action.card, None, None
                 )
                 if turn_finished:
-                    winner = self.winner()
+                    winner = self._turn_winner()
                     should_stop = winner is not None
                     return turn_finished, should_stop, winner
                 self.resolving_one_off = True
@@ -591,7 +679,7 @@ class GameState:
                 # Handle error: ONE_OFF action requires a card
                 log_print("Error: ONE_OFF action called without a card.")
                 return True, True, None # Stop game on error
-        elif action.action_type == ActionType.COUNTER:
+        elif action_type == ActionType.COUNTER:
             if action.card is not None and action.target is not None:
                 action.card.purpose = Purpose.COUNTER
                 if action.card.played_by is not None: # Check played_by before use
@@ -608,14 +696,14 @@ class GameState:
                     last_resolved_by=None,
                 )
                 if turn_finished:
-                    winner = self.winner()
+                    winner = self._turn_winner()
                     should_stop = winner is not None
                     return turn_finished, should_stop, winner
             else:
                 # Handle error: COUNTER action requires card and target
                 log_print("Error: COUNTER action called without card or target.")
                 return True, True, None # Stop game on error
-        elif action.action_type == ActionType.RESOLVE:
+        elif action_type == ActionType.RESOLVE:
             if action.target is not None:
                 turn_finished, played_by = self.play_one_off(
                     self.turn, action.target, None, action.played_by
@@ -627,26 +715,26 @@ class GameState:
                     # Wait for discard selection to complete the effect.
                     return False, should_stop, winner
                 if turn_finished:
-                    winner = self.winner()
+                    winner = self._turn_winner()
                     should_stop = winner is not None
                     return turn_finished, should_stop, winner
             else:
                 # Handle error: RESOLVE action requires a target
                 log_print("Error: RESOLVE action called without a target.")
                 return True, True, None # Stop game on error
-        elif action.action_type == ActionType.FACE_CARD:
+        elif action_type == ActionType.FACE_CARD:
             if action.card is not None:
                 won = self.play_face_card(action.card, action.target) # Target can be None for King/Queen
                 turn_finished = True
                 if won:
                     should_stop = True
-                    winner = self.winner()
+                    winner = self.turn
                 return turn_finished, should_stop, winner
             else:
                 # Handle error: FACE_CARD action requires a card
                 log_print("Error: FACE_CARD action called without a card.")
                 return True, True, None # Stop game on error
-        elif action.action_type == ActionType.JACK:
+        elif action_type == ActionType.JACK:
             if action.card is not None and action.target is not None:
                 # Check if opponent has a queen on their field
                 # implement play_face_card with optional target
@@ -654,7 +742,7 @@ class GameState:
                 turn_finished = True
                 if won:
                     should_stop = True
-                    winner = self.winner()
+                    winner = self.turn
                 return turn_finished, should_stop, winner
             else:
                 # Handle error: JACK action requires card and target
@@ -663,6 +751,17 @@ class GameState:
 
         return turn_finished, should_stop, winner
 
+    def _turn_winner(self) -> Optional[int]:
+        """Get the winner after the player whose turn it is has acted.
+
+        No action can raise the score or lower the target of the player who
+        is not taking the turn, so only the turn player needs checking.
+
+        Returns:
+            Optional[int]: The turn player's index if they have won, None otherwise.
+        """
+        return self.turn if self.is_winner(self.turn) else None
+
     def draw_card(self, count: int = 1) -> None:
         """
         Draw a card from the deck.
@@ -696,9 +795,10 @@ class GameState:
 
         # check if the player has won
         if self.get_player_score(self.turn) >= self.get_player_target(self.turn):
-            print(
-                f"Player {self.turn} wins! Score: {self.get_player_score(self.turn)} points (target: {self.get_player_target(self.turn)} with {len([c for c in self.fields[self.turn] if c.rank == Rank.KING])} Kings)"
-            )
+            if GameState.VERBOSE:
+                print(
+                    f"Player {self.turn} wins! Score: {self.get_player_score(self.turn)} points (target: {self.get_player_target(self.turn)} with {len([c for c in self.fields[self.turn] if c.rank is Rank.KING])} Kings)"
+                )
             self.status = "win"
             return True
         return False
@@ -720,9 +820,8 @@ class GameState:
         card.played_by = self.turn
         card_player = card.played_by
         if card_player is not None:
-            if card in self.hands[card_player]:
-                log_print(f"Removing card {card} from card player's hand")
-                self.hands[card_player].remove(card)
+            if _remove_card(self.hands[card_player], card):
+                log_print(f"Removed card {card} from card player's hand")
             else:
                 log_print(f"Card {card} not found on card player's hand")
                 raise Exception(f"Card {card} not found on card player's hand")
@@ -730,9 +829,8 @@ class GameState:
 
         target_player = target.played_by
         if target_player is not None:
-            if target in self.fields[target_player]:
-                log_print(f"Removing target card {target} from target player's field")
-                self.fields[target_player].remove(target)
+            if _remove_card(self.fields[target_player], target):
+                log_print(f"Removed target card {target} from target player's field")
             else:
                 log_print(f"Target card {target} not found on target player's field")
                 raise Exception(f"Target card {target} not found on target player's field")
@@ -770,7 +868,7 @@ class GameState:
             # Validate counter card
             if countered_with.point_value() != 2:
                 raise Exception("Counter must be a 2")
-            if countered_with.purpose != Purpose.COUNTER:
+            if countered_with.purpose is not Purpose.COUNTER:
                 raise Exception(
                     f"Counter must be with a purpose of counter, instead got {countered_with.purpose}"
                 )
@@ -781,7 +879,7 @@ class GameState:
                 # check if other player has a queen on their field
                 other_player_field = self.fields[other_player]
                 queen_on_opponent_field = any(
-                    card.rank == Rank.QUEEN for card in other_player_field
+                    card.rank is Rank.QUEEN for card in other_player_field
                 )
                 if queen_on_opponent_field:
                     raise Exception(
@@ -791,14 +889,14 @@ class GameState:
             # Move counter card to discard pile
             log_print(f"Moving counter card {countered_with} to discard pile")
             played_by = countered_with.played_by
-            if played_by is not None and countered_with in self.hands[played_by]:
-                self.hands[played_by].remove(countered_with)
+            if played_by is not None and _remove_card(
+                self.hands[played_by], countered_with
+            ):
                 self._move_card_to_discard(countered_with)
                 log_print(f"Counter card {countered_with} moved to discard pile")
 
             # Move the countered card to discard pile if it's still in hand
-            if card in self.hands[self.turn]:
-                self.hands[self.turn].remove(card)
+            _remove_card(self.hands[self.turn], card)
             if card not in self.discard_pile:
                 self._move_card_to_discard(card)
 
@@ -812,8 +910,7 @@ class GameState:
 
             if last_resolved_by != self.turn:
                 # Opponent didn't counter, so one-off resolves
-                if card in self.hands[self.turn]:
-                    self.hands[self.turn].remove(card)
+                _remove_card(self.hands[self.turn], card)
                 card.purpose = Purpose.ONE_OFF
                 self.apply_one_off_effect(card)
                 if card not in self.discard_pile:
@@ -821,8 +918,7 @@ class GameState:
             else:
                 # Original player accepts counter
                 # One-off is countered, move to discard
-                if card in self.hands[self.turn]:
-                    self.hands[self.turn].remove(card)
+                _remove_card(self.hands[self.turn], card)
                 if card not in self.discard_pile:
                     self._move_card_to_discard(card)
 
@@ -836,34 +932,36 @@ class GameState:
         return True, None
 
     def apply_one_off_effect(self, card: Card) -> None:
-        print(f"Applying one off effect for {card}")
-        print(len(self.hands[self.turn]))
-        if card.rank == Rank.ACE:
+        if GameState.VERBOSE:
+            print(f"Applying one off effect for {card}")
+            print(len(self.hands[self.turn]))
+        if card.rank is Rank.ACE:
             # Clear all point cards from all players' fields
             for player_field in self.fields:
-                point_cards = [
-                    card
-                    for card in player_field
-                    if card.is_point_card() and card.purpose == Purpose.POINTS
-                ]
-                for point_card in point_cards:
-                    player_field.remove(point_card)
-                    self._move_card_to_discard(point_card)
-        elif card.rank == Rank.THREE:
+                # Split the field in one pass instead of removing cards one by one
+                kept: List[Card] = []
+                for field_card in player_field:
+                    if field_card.is_point_card() and field_card.purpose is Purpose.POINTS:
+                        self._move_card_to_discard(field_card)
+                    else:
+                        kept.append(field_card)
+                player_field[:] = kept
+        elif card.rank is Rank.THREE:
             # Allow player to take a card from the discard pile
             if not self.discard_pile:
-                print("No cards in discard pile to take")
+                if GameState.VERBOSE:
+                    print("No cards in discard pile to take")
                 return
 
             # Get the player's choice
-            print(f"self.use_ai: {self.use_ai}")
-            print(f"self.turn: {self.turn}")
+            if GameState.VERBOSE:
+                print(f"self.use_ai: {self.use_ai}")
+                print(f"self.turn: {self.turn}")
             chosen_card = None
             if self.use_ai and self.turn == 1:
                 if self.ai_player is not None:
                     chosen_card = self.ai_player.choose_card_from_discard(self.discard_pile)
-                    if chosen_card in self.discard_pile:
-                        self.discard_pile.remove(chosen_card)
+                    _remove_card(self.discard_pile, chosen_card)
                     self.hands[self.turn].append(chosen_card)
                     print(f"AI chose {chosen_card} from discard pile")
                 else:
@@ -896,13 +994,14 @@ class GameState:
                 self.pending_three_player = self.turn
                 self.current_action_player = self.turn
                 return
-        elif card.rank == Rank.FOUR:
+        elif card.rank is Rank.FOUR:
             # Opponent needs to select 2 cards from their hand to discard
             # if opponent only has 1 card, they can discard that one
 
             # Get the player's choice
-            print(f"self.use_ai: {self.use_ai}")
-            print(f"self.turn: {self.turn}")
+            if GameState.VERBOSE:
+                print(f"self.use_ai: {self.use_ai}")
+                print(f"self.turn: {self.turn}")
             chosen_cards = None
             opponent = (self.turn + 1) % len(self.hands)
             discard_prompt = f"player {opponent} must discard 2 cards"
@@ -922,8 +1021,7 @@ class GameState:
                     )
                     log_print(f"AI chose {chosen_cards} from hand to discard")
                     for chosen_card in chosen_cards:
-                        if chosen_card in self.hands[opponent]:
-                            self.hands[opponent].remove(chosen_card)
+                        if _remove_card(self.hands[opponent], chosen_card):
                             self.discard_pile.append(chosen_card)
                             chosen_card.clear_player_info()
                 else:
@@ -973,25 +1071,24 @@ class GameState:
                 self.pending_four_count = min(2, len(self.hands[opponent]))
                 self.current_action_player = opponent
                 return
-        elif card.rank == Rank.FIVE:
+        elif card.rank is Rank.FIVE:
             if len(self.hands[self.turn]) <= 6:
                 self.draw_card(2)
             elif len(self.hands[self.turn]) == 7:
                 self.draw_card(1)
             else:
                 pass
-        elif card.rank == Rank.SIX:
+        elif card.rank is Rank.SIX:
             # Clear all face cards from all players' fields
             for player_field in self.fields:
-                face_cards = [
-                    card
-                    for card in player_field
-                    if card.is_face_card() and card.purpose == Purpose.FACE_CARD
-                ]
-                for face_card in face_cards:
-                    player_field.remove(face_card)
-                    self._move_card_to_discard(face_card)
-        elif card.rank == Rank.SEVEN:
+                kept = []
+                for field_card in player_field:
+                    if field_card.is_face_card() and field_card.purpose is Purpose.FACE_CARD:
+                        self._move_card_to_discard(field_card)
+                    else:
+                        kept.append(field_card)
+                player_field[:] = kept
+        elif card.rank is Rank.SEVEN:
             if not self.deck:
                 log_print("No cards in deck to reveal")
                 return
@@ -1037,14 +1134,14 @@ class GameState:
             bool: True if the player has won, False otherwise
         """
         # For Jack, target is required and must be a point card
-        if card.rank == Rank.JACK:
+        if card.rank is Rank.JACK:
             if target is None:
                 raise Exception("Target card is required for playing Jack")
-            if target.purpose != Purpose.POINTS: # Check purpose after confirming target is not None
+            if target.purpose is not Purpose.POINTS: # Check purpose after confirming target is not None
                 raise Exception("Target card must be a point card for playing Jack")
 
         # Remove from hand and add to field/attachments
-        if card.rank != Rank.JACK:
+        if card.rank is not Rank.JACK:
             if card not in self.hands[self.turn]:
                 raise Exception(f"Can only play cards from your hand, card: {card} not in hand: {self.hands[self.turn]}")
             self.hands[self.turn].remove(card)
@@ -1053,10 +1150,11 @@ class GameState:
             self.fields[self.turn].append(card)
 
             # Check for instant win with King (if points already meet new target)
-            if card.rank == Rank.KING and self.is_winner(self.turn):
-                print(
-                    f"Player {self.turn} wins! Score: {self.get_player_score(self.turn)} points (target: {self.get_player_target(self.turn)} with {len([c for c in self.fields[self.turn] if c.rank == Rank.KING])} Kings)"
-                )
+            if card.rank is Rank.KING and self.is_winner(self.turn):
+                if GameState.VERBOSE:
+                    print(
+                        f"Player {self.turn} wins! Score: {self.get_player_score(self.turn)} points (target: {self.get_player_target(self.turn)} with {len([c for c in self.fields[self.turn] if c.rank is Rank.KING])} Kings)"
+                    )
                 self.status = "win"
                 return True
 
@@ -1065,7 +1163,7 @@ class GameState:
             target = cast(Card, target)
             opponent = (self.turn + 1) % len(self.hands)
             queen_on_opponent_field = any(
-                c.rank == Rank.QUEEN for c in self.fields[opponent]
+                c.rank is Rank.QUEEN for c in self.fields[opponent]
             )
             if queen_on_opponent_field:
                 raise Exception(
@@ -1074,7 +1172,7 @@ class GameState:
 
             # Target is guaranteed not None here due to earlier check
             # Verify target is a point card (redundant check, but safe)
-            if not target.is_point_card() or target.purpose != Purpose.POINTS:
+            if not target.is_point_card() or target.purpose is not Purpose.POINTS:
                 raise Exception("Jack can only be played on point cards")
 
             # Remove Jack from hand
@@ -1087,11 +1185,13 @@ class GameState:
             # Attach Jack to the target card
             target.attachments.append(card) # target confirmed not None
 
-            winner = self.winner()
-            if winner is not None:
-                print(
-                    f"Player {winner} wins! Score: {self.get_player_score(winner)} points (target: {self.get_player_target(winner)} with {len([c for c in self.fields[winner] if c.rank == Rank.KING])} Kings)"
-                )
+            # Taking control of points can only make the Jack's player win
+            if self.is_winner(self.turn):
+                winner = self.turn
+                if GameState.VERBOSE:
+                    print(
+                        f"Player {winner} wins! Score: {self.get_player_score(winner)} points (target: {self.get_player_target(winner)} with {len([c for c in self.fields[winner] if c.rank is Rank.KING])} Kings)"
+                    )
                 self.status = "win"
                 return True
         return False
@@ -1157,13 +1257,13 @@ class GameState:
             twos = [
                 card
                 for card in self.hands[self.current_action_player]
-                if card.rank == Rank.TWO
+                if card.rank is Rank.TWO
             ]
             # if opponent has a queen on their field, can't counter with a two, cannot counter
             other_player = (self.current_action_player + 1) % len(self.hands)
             other_player_field = self.fields[other_player]
             queen_on_opponent_field = any(
-                card.rank == Rank.QUEEN for card in other_player_field
+                card.rank is Rank.QUEEN for card in other_player_field
             )
 
             if queen_on_opponent_field:
@@ -1190,58 +1290,63 @@ class GameState:
             )
             return actions
 
-        # Allow drawing a card only if hand is not full (max 8 cards)
-        if len(self.hands[self.turn]) < 8:
-            actions.append(Action(ActionType.DRAW, self.turn))
-
-        # Get cards in current player's hand
-        hand = self.hands[self.turn]
+        # Read the attributes used in the loops below once
+        turn = self.turn
+        hand = self.hands[turn]
+        num_players = len(self.hands)
+        append = actions.append
 
-        # Can play any card as points (2-10)
+        # Allow drawing a card only if hand is not full (max 8 cards)
+        if len(hand) < 8:
+            append(_DRAW_ACTIONS[turn])
+
+        # Group the current player's hand by the ways each card can be played
+        playable: Dict[ActionType, List[Card]] = {
+            ActionType.POINTS: [],
+            ActionType.FACE_CARD: [],
+            ActionType.JACK: [],
+            ActionType.ONE_OFF: [],
+            ActionType.SCUTTLE: [],
+        }
         for card in hand:
-            if card.point_value() <= Rank.TEN.value[1]:
-                actions.append(Action(ActionType.POINTS, self.turn, card=card))
+            for action_type in RANK_ACTIONS[card.rank]:
+                playable[action_type].append(card)
+
+        pooled_action = self._pooled_action
+        # Can play any card as points (Ace-10)
+        for card in playable[ActionType.POINTS]:
+            append(pooled_action(ActionType.POINTS, card))
 
         # Can play face cards
-        for card in hand:
-            # Only Kings are implemented for now
-            # TODO: Implement Queens, Jacks, and Eights
-            if card.is_face_card() and card.rank in [Rank.KING, Rank.QUEEN]:
-                actions.append(Action(ActionType.FACE_CARD, self.turn, card=card))
+        # TODO: Implement Eights
+        for card in playable[ActionType.FACE_CARD]:
+            append(pooled_action(ActionType.FACE_CARD, card))
 
-        opponent = (self.current_action_player + 1) % len(self.hands)
-        queen_on_opponent_field = any(
-            card.rank == Rank.QUEEN for card in self.fields[opponent]
-        )
+        opponent = (self.current_action_player + 1) % num_players
+        # Point cards the opponent controls, collected once for Jacks and scuttles
+        opponent_points: Optional[List[Card]] = None
         # Can play Jacks on opponent's point cards on field
-        for card in hand:
-            if card.rank == Rank.JACK and not queen_on_opponent_field:
-                for opponent_card in self.get_player_field(opponent):
-                    if opponent_card.purpose == Purpose.POINTS:
-                        # TODO: also check if card has jacks attached
-                        actions.append(
-                            Action(ActionType.JACK, self.turn, card=card, target=opponent_card)
-                        )
+        jacks = playable[ActionType.JACK]
+        if jacks and not any(card.rank is Rank.QUEEN for card in self.fields[opponent]):
+            opponent_points = self.player_point_cards(opponent)
+            for card in jacks:
+                for opponent_card in opponent_points:
+                    # TODO: also check if card has jacks attached
+                    append(Action(ActionType.JACK, turn, card=card, target=opponent_card))
 
         # Can play one-offs
-        for card in hand:
-            if card.is_one_off():
-                actions.append(Action(ActionType.ONE_OFF, self.turn, card=card))
+        for card in playable[ActionType.ONE_OFF]:
+            append(pooled_action(ActionType.ONE_OFF, card))
 
         # Can scuttle opponent's point cards with higher point cards (only point cards can scuttle)
-        opponent = (self.turn + 1) % len(self.hands)
-        opponent_points = []
-        for card in self.fields[opponent]:
-            if self._is_point_controlled_by(opponent, card):
-                opponent_points.append(card)
-        for card in self.fields[self.turn]:
-            if self._is_point_controlled_by(opponent, card):
-                opponent_points.append(card)
-
-        # Get point cards from hand (Ace to Ten)
-        point_cards = [card for card in hand if card.point_value() <= Rank.TEN.value[1]]
+        # Point cards from hand (Ace to Ten) can scuttle
+        point_cards = playable[ActionType.SCUTTLE]
+        scuttle_opponent = (turn + 1) % num_players
+        if not point_cards:
+            opponent_points = []
+        elif opponent_points is None or scuttle_opponent != opponent:
+            opponent_points = self.player_point_cards(scuttle_opponent)
 
-        print(f"opponent_points: {opponent_points}")
         # For each point card in opponent's field
         for opponent_card in opponent_points:
             # For each point card in player's hand
@@ -1249,15 +1354,30 @@ class GameState:
                 # Can scuttle if:
                 # 1. Higher point value, or
                 # 2. Equal point value and higher suit value
-                if card.point_value() > opponent_card.point_value() or (
-                    card.point_value() == opponent_card.point_value()
-                    and card.suit_value() > opponent_card.suit_value()
-                ):
-                    actions.append(
-                        Action(ActionType.SCUTTLE, self.turn, card=card, target=opponent_card)
-                    )
+                if card.beats(opponent_card):
+                    append(Action(ActionType.SCUTTLE, turn, card=card, target=opponent_card))
         return actions
 
+    def _pooled_action(self, action_type: ActionType, card: Card) -> Action:
+        """Get the action of the turn player playing ``card`` from hand.
+
+        Untargeted actions only depend on their type, card and player, so
+        each one is built once per game and handed out again on later calls.
+
+        Args:
+            action_type (ActionType): POINTS, FACE_CARD or ONE_OFF.
+            card (Card): The card played from the turn player's hand.
+
+        Returns:
+            Action: The pooled action.
+        """
+        key = (action_type, card, self.turn)
+        action = self._action_pool.get(key)
+        if action is None:
+            action = Action(action_type, self.turn, card=card)
+            self._action_pool[key] = action
+        return action
+
     def print_state(self, hide_player_hand: Optional[int] = None) -> None:
         """Print the current game state to the console.
 
@@ -1302,6 +1422,126 @@ class GameState:
             self.logger(f"Status: {self.status}")
         self.logger("=" * 20 + "\n")
 
+    def zobrist_hash(self) -> int:
+        """Compute a Zobrist hash of the position for transposition tables.
+
+        Every card contributes the key for the zone it lies in (deck, discard,
+        a hand, points, stolen points, face cards, attached Jacks, or pending
+        resolution), and the turn and resolution flags are mixed in. Positions
+        reached through different move orders hash equally. Deck order is not
+        part of the hash: within one search the deck only shrinks from the top,
+        so equal deck contents imply equal order. A table kept across searches
+        must be dropped when the deck is not a prefix of the one it was
+        filled for, as ``MinimaxPlayer`` does.
+
+        Returns:
+            int: A 64-bit hash of the position.
+        """
+        h = 0
+        for card in self.deck:
+            h ^= card.zobrist_key(_ZONE_DECK)
+        for card in self.discard_pile:
+            h ^= card.zobrist_key(_ZONE_DISCARD)
+        for player, hand in enumerate(self.hands):
+            for card in hand:
+                h ^= card.zobrist_key(_ZONE_HAND + player)
+        for player, field in enumerate(self.fields):
+            for card in field:
+                if card.purpose is Purpose.POINTS:
+                    zone = _ZONE_STOLEN if card.is_stolen() else _ZONE_POINTS
+                else:
+                    zone = _ZONE_FACE
+                h ^= card.zobrist_key(zone + player)
+                for attachment in card.attachments:
+                    h ^= attachment.zobrist_key(_ZONE_ATTACHED)
+        if self.one_off_card_to_counter is not None:
+            h ^= self.one_off_card_to_counter.zobrist_key(_ZONE_COUNTER_TARGET)
+        for card in self.pending_seven_cards:
+            h ^= card.zobrist_key(_ZONE_REVEALED)
+        flags = hash(
+            (
+                self.turn,
+                self.current_action_player,
+                self.resolving_two,
+                self.resolving_one_off,
+                self.resolving_three,
+                self.resolving_four,
+                self.pending_four_count,
+                self.resolving_seven,
+                self.pending_seven_requires_discard,
+            )
+        )
+        return (h ^ flags) & _HASH_MASK
+
+    def clone(self, memo: Optional[Dict[int, Any]] = None) -> "GameState":
+        """Create an independent copy of the game state for look-ahead search.
+
+        All cards are copied so the clone can be mutated freely, while card
+        identity is preserved across zones (e.g. a Jack's attachments or the
+        one-off awaiting a counter still reference the copied cards). The
+        logger and AI player are shared rather than copied, and the clone
+        starts with an empty game history.
+
+        The copy is built slot by slot rather than with ``copy.deepcopy`` on
+        the whole state, which keeps cloning cheap enough for tree search.
+        Update this method when adding a slot to GameState.
+
+        Args:
+            memo (Optional[Dict[int, Any]]): ``copy.deepcopy`` memo to fill. Pass
+                the same dict to ``copy.deepcopy(action, memo)`` afterwards to
+                get an action that refers to the clone's cards.
+
+        Returns:
+            GameState: A copy of this game state.
+        """
+        if memo is None:
+            memo = {}
+
+        def copy_cards(cards: List[Card]) -> List[Card]:
+            copied = []
+            for card in cards:
+                card_copy = memo.get(id(card))
+                if card_copy is None:
+                    card_copy = card.__deepcopy__(memo)
+                copied.append(card_copy)
+            return copied
+
+        state = GameState.__new__(GameState)
+        memo[id(self)] = state
+        state.hands = [copy_cards(hand) for hand in self.hands]
+        state.fields = [copy_cards(field) for field in self.fields]
+        state.deck = copy_cards(self.deck)
+        state.discard_pile = copy_cards(self.discard_pile)
+        state.pending_seven_cards = copy_cards(self.pending_seven_cards)
+        if self.one_off_card_to_counter is None:
+            state.one_off_card_to_counter = None
+        else:
+            state.one_off_card_to_counter = copy_cards([self.one_off_card_to_counter])[0]
+
+        state.turn = self.turn
+        state.current_action_player = self.current_action_player
+        state.status = self.status
+        state.resolving_two = self.resolving_two
+        state.resolving_one_off = self.resolving_one_off
+        state.resolving_three = self.resolving_three
+        state.pending_three_player = self.pending_three_player
+        state.resolving_seven = self.resolving_seven
+        state.pending_seven_player = self.pending_seven_player
+        state.pending_seven_requires_discard = self.pending_seven_requires_discard
+        state.resolving_four = self.resolving_four
+        state.pending_four_player = self.pending_four_player
+        state.pending_four_count = self.pending_four_count
+        state.use_ai = self.use_ai
+        state.input_mode = self.input_mode
+        state.overall_turn = self.overall_turn
+        state.last_action_played_by = self.last_action_played_by
+
+        state.logger = self.logger
+        state.ai_player = self.ai_player
+        state.game_history = GameHistory()
+        state._action_pool = {}
+        return state
+
     def to_dict(self) -> Dict:
         """
         Convert the game state to a dictionary for saving.
@@ -9,6 +9,7 @@ The module supports both interactive terminal environments and non-interactive e
 """
 
 import errno
+import io
 import os
 import sys
 from typing import List, Tuple
@@ -58,6 +59,18 @@ def get_terminal_size() -> Tuple[int, int]:
         return (80, 24)  # Default size
 
 
+def _clear_lines_sequence(num_lines: int) -> str:
+    """Build the ANSI escape sequence that clears lines above the cursor.
+
+    Args:
+        num_lines: The number of lines to clear above the current cursor position.
+
+    Returns:
+        str: Move-up-one-line and clear-line codes, repeated num_lines times.
+    """
+    return "\033[F\033[K" * num_lines
+
+
 def clear_lines(num_lines: int) -> None:
     """Clear the specified number of lines above the cursor.
 
@@ -68,9 +81,7 @@ def clear_lines(num_lines: int) -> None:
         num_lines: The number of lines to clear above the current cursor position.
     """
     if is_interactive_terminal():
-        for _ in range(num_lines):
-            sys.stdout.write("\033[F")  # Move cursor up one line
-            sys.stdout.write("\033[K")  # Clear line
+        sys.stdout.write(_clear_lines_sequence(num_lines))
 
 
 def display_options(
@@ -100,28 +111,33 @@ def display_options(
         is_initial_display: Whether this is the first display of options.
     """
     if is_interactive_terminal():
+        # Build the whole frame first and write it to the terminal at once
+        frame = io.StringIO()
         # Clear the entire display area first
         if not is_initial_display:
             if len(pre_filtered_options) == 0:
-                clear_lines(min(len(pre_filtered_options), max_display) + 2)
+                frame.write(
+                    _clear_lines_sequence(min(len(pre_filtered_options), max_display) + 2)
+                )
             else:
-                clear_lines(min(len(pre_filtered_options), max_display) + 1)
+                frame.write(
+                    _clear_lines_sequence(min(len(pre_filtered_options), max_display) + 1)
+                )
 
         # Print prompt and current input
-        sys.stdout.write(f"\r{prompt} {current_input}")
-        sys.stdout.flush()
+        frame.write(f"\r{prompt} {current_input}")
 
         # Print filtered options
         if filtered_options:
-            sys.stdout.write("\n")
+            frame.write("\n")
+            blank_line = "\r" + " " * terminal_width + "\r"
             for i, option in enumerate(filtered_options[:max_display]):
                 prefix = "→ " if i == selected_idx else "  "
-                # Clear the entire line first
-                sys.stdout.write("\r" + " " * terminal_width + "\r")
-                # Write the option aligned to the left
-                sys.stdout.write(f"{prefix}{option}\n")
+                # Clear the entire line first, then write the option aligned left
+                frame.write(f"{blank_line}{prefix}{option}\n")
         else:
-            sys.stdout.write("\nNo matching options\n")
+            frame.write("\nNo matching options\n")
+        sys.stdout.write(frame.getvalue())
         sys.stdout.flush()
     else:
         # In non-interactive mode, just print the options once
@@ -164,6 +180,10 @@ def get_interactive_input(prompt: str, options: List[str]) -> int:
             # Initialize variables
             current_input = ""
             filtered_options = options
+            options_lower = [option.lower() for option in options]
+            # Indices of the options matching each prefix of the input, so
+            # typing only narrows the previous matches and backspace pops
+            filter_stack: List[List[int]] = [list(range(len(options)))]
             pre_filtered_options = options
             selected_idx = 0
             max_display = 20  # Maximum number of options to display at once
@@ -196,8 +216,7 @@ def get_interactive_input(prompt: str, options: List[str]) -> int:
                     elif ord(char) == 13:  # Enter
                         if filtered_options:
                             # Find the original index of the selected option
-                            selected_option = filtered_options[selected_idx]
-                            original_idx = options.index(selected_option)
+                            original_idx = filter_stack[-1][selected_idx]
                             # Restore terminal settings before returning
                             termios.tcsetattr(
                                 sys.stdin, termios.TCSADRAIN, old_settings
@@ -213,12 +232,9 @@ def get_interactive_input(prompt: str, options: List[str]) -> int:
                     elif ord(char) == 127:  # Backspace
                         if current_input:
                             current_input = current_input[:-1]
-                            # Update filtered options
-                            filtered_options = [
-                                opt
-                                for opt in options
-                                if current_input.lower() in opt.lower()
-                            ]
+                            # Restore the matches for the shorter input
+                            filter_stack.pop()
+                            filtered_options = [options[i] for i in filter_stack[-1]]
                             selected_idx = 0
                     elif ord(char) == 27:  # Escape sequence
                         next_char = sys.stdin.read(1)
@@ -238,12 +254,12 @@ def get_interactive_input(prompt: str, options: List[str]) -> int:
                                 )
                     elif ord(char) >= 32:  # Printable characters
                         current_input += char
-                        # Update filtered options
-                        filtered_options = [
-                            opt
-                            for opt in options
-                            if current_input.lower() in opt.lower()
-                        ]
+                        # Anything matching the longer input matched the
+                        # shorter one, so only the previous matches are checked
+                        needle = current_input.lower()
+                        matches = [i for i in filter_stack[-1] if needle in options_lower[i]]
+                        filter_stack.append(matches)
+                        filtered_options = [options[i] for i in matches]
                         selected_idx = 0
 
                     # Refresh display after any change
@@ -0,0 +1,391 @@
+"""
+Minimax AI player module for the Cuttle card game.
+
+This module provides the MinimaxPlayer class, a classical search-based decision
+engine. It runs a negamax search with alpha-beta pruning over cloned game states,
+so it needs neither an LLM nor a trained model and decides in milliseconds. It
+can be used as a drop-in replacement for the LLM-based AIPlayer.
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from game.action import Action, ActionType
+from game.card import Card, Rank
+from game.game_state import GameState
+from game.utils import log_print
+
+# Value of a won position; large enough to dominate any heuristic evaluation
+WIN_VALUE = 1000.0
+
+# Transposition table bound flags
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+
+def _acting_player(state: GameState) -> int:
+    """Return the player who chooses the next action in ``state``."""
+    if (
+        state.resolving_one_off
+        or state.resolving_three
+        or state.resolving_four
+        or state.resolving_seven
+    ):
+        return state.current_action_player
+    return state.turn
+
+
+def _advance_turn(state: GameState, turn_finished: bool) -> None:
+    """Advance turn bookkeeping after an action, mirroring the API game loop."""
+    if turn_finished:
+        state.resolving_one_off = False
+
+    if state.resolving_three or state.resolving_four or state.resolving_seven:
+        return
+
+    if state.resolving_one_off:
+        state.next_player()
+    else:
+        state.next_turn()
+
+
+def _move_order_key(action: Action) -> int:
+    """Sort key that tries the moves with the largest evaluation swings first.
+
+    Scuttles and Kings change the score or target immediately, so searching
+    them first tightens the alpha-beta window early and maximizes cutoffs.
+    Point plays follow (highest value first) and drawing is tried last.
+    """
+    if action.action_type == ActionType.SCUTTLE:
+        return 0
+    if action.action_type == ActionType.FACE_CARD and action.card is not None:
+        if action.card.rank is Rank.KING:
+            return 1
+    if action.action_type == ActionType.POINTS and action.card is not None:
+        return 20 - action.card.point_value()
+    if action.action_type == ActionType.DRAW:
+        return 40
+    return 30
+
+
+class MinimaxPlayer:
+    """AI player that searches the game tree with alpha-beta negamax.
+
+    The search treats the game as one of perfect information: it sees both
+    hands and the deck order of the state it is given. Positions are scored
+    from the point of view of the player to act, and alpha-beta pruning with
+    move ordering keeps the explored tree close to O(b^(d/2)) nodes.
+
+    Positions reached through different move orders are searched once: results
+    are cached in a transposition table keyed by ``GameState.zobrist_hash()``.
+    The table carries over between moves of a game and is cleared when the deck
+    no longer continues the one it was filled for, such as in a new game.
+
+    The search deepens iteratively, one ply at a time. Each iteration stores its
+    best moves in the transposition table, so the next, deeper iteration tries
+    them first. With a time budget the search stops when the budget runs out
+    and plays the best move of the deepest completed iteration.
+
+    Attributes:
+        depth (int): Maximum number of plies to search ahead.
+        time_budget (Optional[float]): Seconds allowed per decision, or None to
+            always search to full depth.
+        max_table_size (int): Entries kept in the transposition table before it
+            is cleared.
+        nodes_searched (int): Nodes visited during the most recent search.
+        depth_reached (int): Deepest fully searched iteration of the most
+            recent search.
+    """
+
+    def __init__(
+        self,
+        depth: int = 4,
+        time_budget: Optional[float] = None,
+        max_table_size: int = 1_000_000,
+    ) -> None:
+        """Initialize the minimax player.
+
+        Args:
+            depth (int, optional): Maximum number of plies to search. Defaults to 4.
+            time_budget (Optional[float], optional): Seconds allowed per decision.
+                The first ply is always completed. Defaults to None (no limit).
+            max_table_size (int, optional): Transposition table capacity.
+                Defaults to 1,000,000 entries.
+
+        Raises:
+            ValueError: If depth is less than 1.
+        """
+        if depth < 1:
+            raise ValueError("Search depth must be at least 1")
+        self.depth = depth
+        self.time_budget = time_budget
+        self.max_table_size = max_table_size
+        self.nodes_searched = 0
+        self.depth_reached = 0
+        self._deadline: Optional[float] = None
+        # zobrist hash -> (depth, value, bound flag, best action index)
+        self._tt: Dict[int, Tuple[int, float, int, Optional[int]]] = {}
+        # Card indices of the deck the table was filled for, bottom to top
+        self._tt_deck: Tuple[int, ...] = ()
+
+    async def get_action(
+        self, game_state: GameState, legal_actions: List[Action]
+    ) -> Action:
+        """Choose the best action found by the search.
+
+        Args:
+            game_state (GameState): The current state of the game.
+            legal_actions (List[Action]): List of legal actions available.
+
+        Returns:
+            Action: The chosen action to perform.
+
+        Raises:
+            ValueError: If no legal actions are available.
+        """
+        return self.get_action_sync(game_state, legal_actions)
+
+    def get_action_sync(
+        self, game_state: GameState, legal_actions: List[Action]
+    ) -> Action:
+        """Synchronous version of get_action.
+
+        Args:
+            game_state (GameState): The current state of the game.
+            legal_actions (List[Action]): List of legal actions available. This
+                must be the list returned by ``game_state.get_legal_actions()``.
+
+        Returns:
+            Action: The chosen action to perform.
+
+        Raises:
+            ValueError: If no legal actions are available.
+        """
+        if not legal_actions:
+            raise ValueError("No legal actions available")
+        if len(legal_actions) == 1:
+            return legal_actions[0]
+
+        # Search on a private copy that never prompts or calls back into an AI
+        root = game_state.clone()
+        root.use_ai = False
+        root.ai_player = None
+        root.input_mode = "api"
+
+        self.nodes_searched = 0
+        # Hashes leave out deck order, which deck contents only determine
+        # while the deck is the one the table was filled for minus cards
+        # drawn from the top; a new deal or a reordered deck starts over
+        deck = tuple(card.index for card in root.deck)
+        if len(self._tt) > self.max_table_size or self._tt_deck[: len(deck)] != deck:
+            self._tt.clear()
+        self._tt_deck = deck
+        root_actions = root.get_legal_actions()
+        if len(root_actions) != len(legal_actions):
+            log_print(
+                "Minimax: legal actions do not match the game state, "
+                "using the first legal action"
+            )
+            return legal_actions[0]
+        value, best_index = self._iterative_deepening(root, root_actions)
+
+        log_print(
+            f"Minimax searched {self.nodes_searched} nodes to depth "
+            f"{self.depth_reached}, best value {value}"
+        )
+        if best_index is None:
+            return legal_actions[0]
+        return legal_actions[best_index]
+
+    def _iterative_deepening(
+        self, root: GameState, root_actions: List[Action]
+    ) -> Tuple[float, Optional[int]]:
+        """Search ``root`` one ply deeper at a time until depth or time runs out.
+
+        Args:
+            root (GameState): The position to search.
+            root_actions (List[Action]): Legal actions for ``root``.
+
+        Returns:
+            Tuple[float, Optional[int]]: Value and best action index from the
+            deepest completed iteration.
+        """
+        start = time.monotonic()
+        self._deadline = None
+        self.depth_reached = 0
+        value, best_index = 0.0, None
+        try:
+            for depth in range(1, self.depth + 1):
+                value, best_index = self._negamax(
+                    root, depth, -math.inf, math.inf, root_actions
+                )
+                self.depth_reached = depth
+                if abs(value) >= WIN_VALUE:
+                    break  # Forced result found; deeper search cannot change it
+                if self.time_budget is not None:
+                    # Only start timing out after one ply so there is always a move
+                    self._deadline = start + self.time_budget
+                    if time.monotonic() >= self._deadline:
+                        break
+        except _SearchTimeout:
+            pass
+        finally:
+            self._deadline = None
+        return value, best_index
+
+    def _negamax(
+        self,
+        state: GameState,
+        depth: int,
+        alpha: float,
+        beta: float,
+        actions: Optional[List[Action]] = None,
+    ) -> Tuple[float, Optional[int]]:
+        """Search ``state`` and return its value for the player to act.
+
+        Args:
+            state (GameState): The position to search. It is not modified.
+            depth (int): Remaining plies to search.
+            alpha (float): Lower bound of the search window.
+            beta (float): Upper bound of the search window.
+            actions (Optional[List[Action]]): Legal actions for ``state`` if
+                already computed.
+
+        Returns:
+            Tuple[float, Optional[int]]: The position value and the index of the
+            best action in ``state.get_legal_actions()``, or None at leaves.
+        """
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            raise _SearchTimeout
+        self.nodes_searched += 1
+        player = _acting_player(state)
+
+        winner = state.winner()
+        if winner is not None:
+            return self._terminal_value(winner, player, depth), None
+        if state.is_stalemate():
+            return 0.0, None
+        if depth == 0:
+            return self._evaluate(state, player), None
+
+        alpha_orig = alpha
+        key = state.zobrist_hash()
+        entry = self._tt.get(key)
+        tt_best: Optional[int] = None
+        if entry is not None:
+            entry_depth, entry_value, entry_flag, tt_best = entry
+            # Hand order can differ between transpositions, so a stored index is
+            # only a move-ordering hint; the root is always searched so the
+            # returned index refers to the caller's action list
+            if entry_depth >= depth and actions is None:
+                if entry_flag == EXACT:
+                    return entry_value, tt_best
+                if entry_flag == LOWER_BOUND:
+                    alpha = max(alpha, entry_value)
+                else:
+                    beta = min(beta, entry_value)
+                if alpha >= beta:
+                    return entry_value, tt_best
+
+        if actions is None:
+            actions = state.get_legal_actions()
+        if not actions:
+            return self._evaluate(state, player), None
+
+        order = sorted(range(len(actions)), key=lambda i: _move_order_key(actions[i]))
+        if tt_best is not None and tt_best < len(actions):
+            # The best move from a previous search of this position goes first
+            order.remove(tt_best)
+            order.insert(0, tt_best)
+        best_value = -math.inf
+        best_index: Optional[int] = None
+        for index in order:
+            # Copying the action with the clone's memo maps its cards onto the clone
+            memo: Dict[int, Any] = {}
+            child = state.clone(memo)
+            child_action = copy.deepcopy(actions[index], memo)
+            turn_finished, should_stop, winner = child.update_state(child_action)
+
+            if should_stop:
+                value = self._terminal_value(winner, player, depth - 1)
+            else:
+                _advance_turn(child, turn_finished)
+                if _acting_player(child) == player:
+                    value, _ = self._negamax(child, depth - 1, alpha, beta)
+                else:
+                    value, _ = self._negamax(child, depth - 1, -beta, -alpha)
+                    value = -value
+
+            if value > best_value:
+                best_value = value
+                best_index = index
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= alpha_orig:
+            flag = UPPER_BOUND
+        elif best_value >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._tt[key] = (depth, best_value, flag, best_index)
+        return best_value, best_index
+
+    @staticmethod
+    def _terminal_value(winner: Optional[int], player: int, depth: int) -> float:
+        """Value of a finished game for ``player``, preferring faster wins."""
+        if winner is None:
+            return 0.0
+        if winner == player:
+            return WIN_VALUE + depth
+        return -WIN_VALUE - depth
+
+    @staticmethod
+    def _evaluate(state: GameState, player: int) -> float:
+        """Heuristic value of a non-terminal position for ``player``.
+
+        Compares how far each player still is from their target, so both
+        scoring points and lowering the target with Kings count as progress.
+        """
+        opponent = (player + 1) % len(state.hands)
+        scores, targets = state.scores_and_targets()
+        own_remaining = targets[player] - scores[player]
+        opponent_remaining = targets[opponent] - scores[opponent]
+        return float(opponent_remaining - own_remaining)
+
+    def choose_card_from_discard(self, discard_pile: List[Card]) -> Card:
+        """Choose a card from the discard pile when playing a Three.
+
+        Args:
+            discard_pile (List[Card]): Available cards in the discard pile.
+
+        Returns:
+            Card: The highest-ranked card.
+
+        Raises:
+            ValueError: If the discard pile is empty.
+        """
+        if not discard_pile:
+            raise ValueError("No cards in discard pile")
+        return max(discard_pile, key=lambda card: card.point_value())
+
+    def choose_two_cards_from_hand(self, hand: List[Card]) -> List[Card]:
+        """Choose up to two cards to discard from hand when affected by a Four.
+
+        Args:
+            hand (List[Card]): Available cards in the hand.
+
+        Returns:
+            List[Card]: Up to two of the lowest-ranked cards.
+        """
+        return sorted(hand, key=lambda card: card.point_value())[:2]
@@ -8,19 +8,53 @@ system and can be used as a drop-in replacement for the LLM-based AIPlayer.
 
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
 from typing import List, Optional
 
 import numpy as np
+import torch
+from gymnasium import spaces
 from sb3_contrib import MaskablePPO
 
 from game.action import Action
 from game.card import Card, Rank
+from game.game import CARD_TEMPLATES, Game
 from game.game_state import GameState
+from rl.action_mapping import build_action_map_and_mask
 from rl.cuttle_env import CuttleRLEnvironment
 from rl.self_play_env import SelfPlayWrapper
 
 
+def _discard_priority(card: Card) -> int:
+    """Rank a card for taking it back from the discard pile (higher is better)."""
+    if card.point_value() <= 10:  # Point cards
+        return card.point_value() + 100  # High priority for point cards
+    elif card.is_face_card():  # Face cards
+        return 50 + card.point_value()  # Medium priority
+    else:  # One-off cards
+        return card.point_value()  # Lower priority
+
+
+def _hand_priority(card: Card) -> int:
+    """Rank a card for keeping it in hand (lower is discarded first)."""
+    if card.point_value() <= 10:  # Point cards
+        return card.point_value()  # Lower point value = lower priority (discard first)
+    elif card.is_face_card():  # Face cards
+        return 100  # High priority (keep)
+    elif card.rank == Rank.TWO:  # Twos are valuable for countering
+        return 90  # High priority (keep)
+    else:  # One-off cards
+        return 50  # Medium priority
+
+
+# Priorities depend only on rank and suit, so they are tabulated by Card.index
+_CARDS_BY_INDEX = sorted((Card(*t) for t in CARD_TEMPLATES), key=lambda card: card.index)
+_DISCARD_PRIORITY = tuple(_discard_priority(card) for card in _CARDS_BY_INDEX)
+_HAND_PRIORITY = tuple(_hand_priority(card) for card in _CARDS_BY_INDEX)
+
+
 class RLAIPlayer:
     """RL-based AI player that uses a trained reinforcement learning model.
     
@@ -38,30 +72,44 @@ class RLAIPlayer:
         model_path (str): Path to the trained RL model.
         model: The loaded MaskablePPO model.
         env: The RL environment for state encoding.
-        max_retries (int): Maximum number of retries for failed predictions.
-        retry_delay (float): Delay in seconds between retries.
+        max_retries (int): Kept for compatibility; predictions are not retried.
+        retry_delay (float): Kept for compatibility; predictions are not retried.
+        quantize (bool): Whether the policy runs with int8 linear layers.
     """
     
     def __init__(
         self, 
         model_path: str = "rl/models/cuttle_rl_final",
         max_retries: int = 3,
-        retry_delay: float = 0.1
+        retry_delay: float = 0.1,
+        quantize: bool = False
     ):
         """Initialize the RL AI player.
         
         Args:
             model_path (str): Path to the trained RL model (without .zip extension).
-            max_retries (int): Maximum number of retries for failed predictions.
-            retry_delay (float): Delay in seconds between retries.
+            max_retries (int): Kept for compatibility; predictions are not retried.
+            retry_delay (float): Kept for compatibility; predictions are not retried.
+            quantize (bool): Whether to run the policy's linear layers with
+                dynamic int8 quantization for faster CPU inference.
         """
         self.model_path = model_path
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.quantize = quantize
         
         # Initialize environment for state encoding
         self.env = CuttleRLEnvironment()
         self.env = SelfPlayWrapper(self.env)
+        # Encoding only needs a Game to hang the current state on; build it once
+        self._unwrapped = self.env.env.unwrapped
+        self._scratch_game = Game()
+        self._unwrapped.game = self._scratch_game
+        # Neither the shared scratch game nor the policy, which keeps the last
+        # action mask on its distribution object, is thread-safe. Each has its
+        # own lock so encoding a new request never waits on a forward pass
+        self._encode_lock = threading.Lock()
+        self._predict_lock = threading.Lock()
         
         # Load the trained model
         self.model = self._load_model()
@@ -82,9 +130,43 @@ class RLAIPlayer:
         
         try:
             model = MaskablePPO.load(self.model_path, env=self.env)
-            return model
+
+            # Inference only: put the policy in eval mode and run one forward
+            # pass so the first real move does not pay for the setup
+            model.policy.set_training_mode(False)
+            if self.quantize:
+                model.policy = torch.ao.quantization.quantize_dynamic(
+                    model.policy, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            observation_shape = self.env.observation_space.shape
+            action_space = model.action_space
+            if observation_shape is None or not isinstance(action_space, spaces.Discrete):
+                raise ValueError("expected a fixed-size observation and discrete actions")
+            with torch.inference_mode():
+                model.predict(
+                    np.zeros(observation_shape, dtype=np.float32),
+                    action_masks=np.ones(int(action_space.n), dtype=np.bool_),
+                    deterministic=True,
+                )
         except Exception as e:
             raise Exception(f"Failed to load model: {e}")
+        return model
+
+    def _predict(self, observation: np.ndarray, action_mask: np.ndarray) -> np.ndarray:
+        """Predict action indices without autograd bookkeeping.
+
+        Args:
+            observation (np.ndarray): One observation or a stacked batch.
+            action_mask (np.ndarray): The matching action mask(s).
+
+        Returns:
+            np.ndarray: The deterministic action index for each observation.
+        """
+        with self._predict_lock, torch.inference_mode():
+            action_index, _ = self.model.predict(
+                observation, action_masks=action_mask, deterministic=True
+            )
+        return action_index
     
     def _encode_game_state(self, game_state: GameState) -> np.ndarray:
         """Encode the game state as an RL observation.
@@ -95,36 +177,26 @@ class RLAIPlayer:
         Returns:
             np.ndarray: Encoded observation vector.
         """
-        # Create a temporary game instance with the current state
-        from game.game import Game
-        temp_game = Game()
-        temp_game.game_state = game_state
-        
-        # Set the game state in the environment
-        self.env.env.unwrapped.game = temp_game
-        
-        # Encode the state using the underlying environment
-        return self.env.env.unwrapped._encode_state()
-    
-    def _get_action_mask(self, legal_actions: List[Action]) -> np.ndarray:
-        """Get action mask for the current legal actions."""
-        from rl.action_mapping import legal_action_mask_from_actions
-
-        return legal_action_mask_from_actions(legal_actions)
+        with self._encode_lock:
+            # Point the scratch game at the current state
+            self._scratch_game.game_state = game_state
+            self._unwrapped.game = self._scratch_game
+            
+            # Encode the state using the underlying environment
+            return self._unwrapped._encode_state()
     
-    async def get_action(
+    def _get_action_core(
         self, 
         game_state: GameState, 
         legal_actions: List[Action]
     ) -> Action:
-        """Get the RL AI's chosen action based on the current game state.
+        """Choose an action synchronously; shared by get_action and get_action_sync.
         
         This method:
-        1. Validates that legal actions are available
+        1. Validates that legal actions are available, returning a forced move directly
         2. Encodes the game state as an RL observation
         3. Uses the trained model to predict the best action
         4. Maps the predicted action index to the actual Action object
-        5. Retries on failure up to max_retries times
         
         Args:
             game_state (GameState): The current state of the game.
@@ -137,48 +209,49 @@ class RLAIPlayer:
             ValueError: If no legal actions are available.
             
         Note:
-            If all retries fail, returns the first legal action as a fallback.
+            If the prediction fails, returns the first legal action as a fallback.
         """
         if not legal_actions:
             raise ValueError("No legal actions available")
+        # A forced move needs no encoding or forward pass
+        if len(legal_actions) == 1:
+            return legal_actions[0]
         
-        retries = 0
-        last_error = None
-        
-        while retries < self.max_retries:
-            try:
-                # Encode the game state
-                observation = self._encode_game_state(game_state)
-                
-                # Get action mask
-                action_mask = self._get_action_mask(legal_actions)
-                
-                # Predict action using the model
-                action_index, _ = self.model.predict(
-                    observation, 
-                    action_masks=action_mask, 
-                    deterministic=True
-                )
-                
-                action_index = int(action_index)
+        # Index the legal actions once; the mask and the decoding share it
+        action_map, action_mask = build_action_map_and_mask(legal_actions)
 
-                from rl.action_mapping import build_action_map
+        # Encoding and a deterministic forward pass either work or fail the
+        # same way every time, so a failure falls back instead of retrying
+        try:
+            observation = self._encode_game_state(game_state)
+            action_index = int(self._predict(observation, action_mask))
+        except Exception as e:
+            print(f"RL AI fallback: prediction failed: {e}")
+            return legal_actions[0]
 
-                action_map = build_action_map(legal_actions)
-                if action_index not in action_map:
-                    return legal_actions[0]
-                return action_map[action_index]
-                
-            except Exception as e:
-                last_error = e
-                retries += 1
-                if retries < self.max_retries:
-                    import time
-                    time.sleep(self.retry_delay)
+        return action_map.get(action_index, legal_actions[0])
+
+    async def get_action(
+        self, 
+        game_state: GameState, 
+        legal_actions: List[Action]
+    ) -> Action:
+        """Get the RL AI's chosen action based on the current game state.
+        
+        Inference blocks, so the work runs in a worker thread
+        and the event loop stays free for other sessions.
         
-        # If all retries failed, return the first legal action as fallback
-        print(f"RL AI fallback: All {self.max_retries} retries failed. Last error: {last_error}")
-        return legal_actions[0]
+        Args:
+            game_state (GameState): The current state of the game.
+            legal_actions (List[Action]): List of legal actions available.
+            
+        Returns:
+            Action: The chosen action to perform.
+            
+        Raises:
+            ValueError: If no legal actions are available.
+        """
+        return await asyncio.to_thread(self._get_action_core, game_state, legal_actions)
     
     def get_action_sync(
         self, 
@@ -194,22 +267,7 @@ class RLAIPlayer:
         Returns:
             Action: The chosen action to perform.
         """
-        import asyncio
-
-        # Run the async method in a new event loop
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're already in an event loop, create a new one
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, self.get_action(game_state, legal_actions))
-                    return future.result()
-            else:
-                return loop.run_until_complete(self.get_action(game_state, legal_actions))
-        except RuntimeError:
-            # No event loop running, create a new one
-            return asyncio.run(self.get_action(game_state, legal_actions))
+        return self._get_action_core(game_state, legal_actions)
     
     def choose_card_from_discard(self, discard_pile: List[Card]) -> Card:
         """Choose a card from the discard pile when playing a Three.
@@ -225,16 +283,7 @@ class RLAIPlayer:
         
         # Simple strategy: choose the highest point value card
         # Prioritize high point cards (7-10), then face cards, then others
-        def card_value(card: Card) -> int:
-            if card.point_value() <= 10:  # Point cards
-                return card.point_value() + 100  # High priority for point cards
-            elif card.is_face_card():  # Face cards
-                return 50 + card.point_value()  # Medium priority
-            else:  # One-off cards
-                return card.point_value()  # Lower priority
-        
-        # Sort by value (highest first) and choose the best card
-        best_card = max(discard_pile, key=card_value)
+        best_card = max(discard_pile, key=lambda card: _DISCARD_PRIORITY[card.index])
         return best_card
     
     def choose_two_cards_from_hand(self, hand: List[Card]) -> List[Card]:
@@ -251,21 +300,140 @@ class RLAIPlayer:
         
         # Simple strategy: discard the lowest value cards
         # Prioritize keeping high point cards, face cards, and Twos
-        def card_priority(card: Card) -> int:
-            if card.point_value() <= 10:  # Point cards
-                return card.point_value()  # Lower point value = lower priority (discard first)
-            elif card.is_face_card():  # Face cards
-                return 100  # High priority (keep)
-            elif card.rank == Rank.TWO:  # Twos are valuable for countering
-                return 90  # High priority (keep)
-            else:  # One-off cards
-                return 50  # Medium priority
-        
         # Sort by priority (lowest first) and take up to 2 cards
-        sorted_hand = sorted(hand, key=card_priority)
+        sorted_hand = sorted(hand, key=lambda card: _HAND_PRIORITY[card.index])
         return sorted_hand[:min(2, len(sorted_hand))]
 
 
+class BatchedRLAIPlayer(RLAIPlayer):
+    """RL AI player that shares forward passes between concurrent games.
+
+    Each ``get_action`` call encodes its observation and queues it. A worker
+    task collects the queued requests, up to ``max_batch`` of them or whatever
+    arrives within ``max_wait`` seconds of the first one, and runs a single
+    batched ``model.predict`` for all of them. This amortizes the per-call
+    inference overhead when one player serves many sessions, as the server's
+    shared RL player does.
+
+    Attributes:
+        max_batch (int): Maximum number of observations per forward pass.
+        max_wait (float): Seconds to wait for more requests after the first.
+    """
+
+    def __init__(
+        self,
+        model_path: str = "rl/models/cuttle_rl_final",
+        max_retries: int = 3,
+        retry_delay: float = 0.1,
+        max_batch: int = 32,
+        max_wait: float = 0.002,
+        quantize: bool = False,
+    ):
+        """Initialize the batched RL AI player.
+
+        Args:
+            model_path (str): Path to the trained RL model (without .zip extension).
+            max_retries (int): Kept for compatibility; predictions are not retried.
+            retry_delay (float): Kept for compatibility; predictions are not retried.
+            max_batch (int): Maximum number of observations per forward pass.
+            max_wait (float): Seconds to wait for more requests after the first.
+            quantize (bool): Whether to quantize the policy, see RLAIPlayer.
+        """
+        super().__init__(model_path, max_retries, retry_delay, quantize)
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        # The queue and worker belong to the event loop that created them
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def _get_queue(self) -> asyncio.Queue:
+        """Get the request queue for the running loop, starting its worker."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run_batches(self._queue))
+        assert self._queue is not None
+        return self._queue
+
+    async def _run_batches(self, queue: asyncio.Queue) -> None:
+        """Serve queued prediction requests in batches until cancelled.
+
+        Args:
+            queue (asyncio.Queue): Queue of (observation, mask, future) triples.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            observations = np.stack([observation for observation, _, _ in batch])
+            masks = np.stack([mask for _, mask, _ in batch])
+            # The forward pass blocks, so run it off the event loop
+            try:
+                action_indices = await asyncio.to_thread(self._predict, observations, masks)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, _, future), action_index in zip(batch, action_indices):
+                if not future.done():
+                    future.set_result(int(action_index))
+
+    async def get_action(
+        self,
+        game_state: GameState,
+        legal_actions: List[Action]
+    ) -> Action:
+        """Get the RL AI's chosen action, predicted in a batch with other games.
+
+        Args:
+            game_state (GameState): The current state of the game.
+            legal_actions (List[Action]): List of legal actions available.
+
+        Returns:
+            Action: The chosen action to perform.
+
+        Raises:
+            ValueError: If no legal actions are available.
+
+        Note:
+            If encoding or the batched prediction fails, returns the first
+            legal action.
+        """
+        if not legal_actions:
+            raise ValueError("No legal actions available")
+        if len(legal_actions) == 1:
+            return legal_actions[0]
+
+        action_map, action_mask = build_action_map_and_mask(legal_actions)
+        # Encoding is synchronous, so the shared scratch game is not interleaved
+        try:
+            observation = self._encode_game_state(game_state)
+        except Exception as e:
+            print(f"RL AI fallback: encoding failed: {e}")
+            return legal_actions[0]
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._get_queue().put((observation, action_mask, future))
+        try:
+            action_index = await future
+        except Exception as e:
+            print(f"RL AI fallback: batched prediction failed: {e}")
+            return legal_actions[0]
+        return action_map.get(action_index, legal_actions[0])
+
+
 class RLAIPlayerWrapper:
     """Wrapper to make RLAIPlayer compatible with existing AIPlayer interface.
     
@@ -273,13 +441,15 @@ class RLAIPlayerWrapper:
     but uses the RL model for decision making.
     """
     
-    def __init__(self, model_path: str = "rl/models/cuttle_rl_final"):
+    def __init__(self, model_path: str = "rl/models/cuttle_rl_final", batched: bool = False):
         """Initialize the RL AI player wrapper.
         
         Args:
             model_path (str): Path to the trained RL model.
+            batched (bool): Whether to batch predictions across concurrent games
+                with BatchedRLAIPlayer. Defaults to False.
         """
-        self.rl_ai = RLAIPlayer(model_path)
+        self.rl_ai = BatchedRLAIPlayer(model_path) if batched else RLAIPlayer(model_path)
         self.model = "rl_model"  # For compatibility
         self.max_retries = 3
         self.retry_delay = 0.1
@@ -111,13 +111,11 @@ def get_action_from_text_input(
     Returns:
         Optional[Action]: The chosen Action object, or None if the action is not found.
     """
-    if player_action.isdigit():
-        try:
-            index = int(player_action)
-            if 0 <= index < len(actions):
-                return actions[index]
-        except ValueError:
-            pass  # Fall through to check text match
+    # isdecimal only accepts what int() parses, so no ValueError to catch
+    if player_action.isdecimal():
+        index = int(player_action)
+        if index < len(actions):
+            return actions[index]
 
     action_str = player_action.lower()
     for action in actions:
@@ -6,7 +6,7 @@ This avoids per-turn reindexing based on legal action list order.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 import numpy as np
 
@@ -51,64 +51,57 @@ ACTION_SPACE_SIZE = _running
 
 def card_index(card: Card) -> int:
     """Return canonical 0..51 index for a card based on rank/suit."""
-    return (card.rank.value[1] - 1) * 4 + card.suit.value[1]
+    # Computed once when the card is built, see Card.index
+    return card.index
 
 
 def _pair_index(attacker_idx: int, target_idx: int) -> int:
     return attacker_idx * NUM_CARDS + target_idx
 
 
+# Offsets of the action types that map to one index, regardless of the card
+_FIXED_INDEX: Dict[ActionType, int] = {
+    ActionType.DRAW: _OFFSETS["draw"],
+    ActionType.RESOLVE: _OFFSETS["resolve"],
+}
+
+# Offsets of the action types indexed by the played card alone
+_CARD_OFFSETS: Dict[ActionType, int] = {
+    ActionType.POINTS: _OFFSETS["points"],
+    ActionType.FACE_CARD: _OFFSETS["face"],
+    ActionType.ONE_OFF: _OFFSETS["one_off"],
+    ActionType.COUNTER: _OFFSETS["counter"],
+    ActionType.TAKE_FROM_DISCARD: _OFFSETS["take_from_discard"],
+    ActionType.DISCARD_FROM_HAND: _OFFSETS["discard_from_hand"],
+    ActionType.DISCARD_REVEALED: _OFFSETS["discard_revealed"],
+}
+
+# Offsets of the action types indexed by the (card, target) pair. Scuttles
+# and Jacks need a target; a one-off without one falls back to _CARD_OFFSETS.
+_PAIR_OFFSETS: Dict[ActionType, int] = {
+    ActionType.ONE_OFF: _OFFSETS["one_off_target"],
+    ActionType.SCUTTLE: _OFFSETS["scuttle"],
+    ActionType.JACK: _OFFSETS["jack"],
+}
+
+
 def action_to_index(action: Action) -> Optional[int]:
     """Map a concrete Action to a fixed action index."""
-    if action.action_type == ActionType.DRAW:
-        return _OFFSETS["draw"]
-    if action.action_type == ActionType.RESOLVE:
-        return _OFFSETS["resolve"]
-    if action.action_type == ActionType.POINTS:
-        if action.card is None:
-            return None
-        return _OFFSETS["points"] + card_index(action.card)
-    if action.action_type == ActionType.FACE_CARD:
-        if action.card is None:
-            return None
-        return _OFFSETS["face"] + card_index(action.card)
-    if action.action_type == ActionType.ONE_OFF:
-        if action.card is None:
-            return None
-        attacker_idx = card_index(action.card)
-        if action.target is None:
-            return _OFFSETS["one_off"] + attacker_idx
-        target_idx = card_index(action.target)
-        return _OFFSETS["one_off_target"] + _pair_index(attacker_idx, target_idx)
-    if action.action_type == ActionType.COUNTER:
-        if action.card is None:
-            return None
-        return _OFFSETS["counter"] + card_index(action.card)
-    if action.action_type == ActionType.TAKE_FROM_DISCARD:
-        if action.card is None:
-            return None
-        return _OFFSETS["take_from_discard"] + card_index(action.card)
-    if action.action_type == ActionType.DISCARD_FROM_HAND:
-        if action.card is None:
-            return None
-        return _OFFSETS["discard_from_hand"] + card_index(action.card)
-    if action.action_type == ActionType.DISCARD_REVEALED:
-        if action.card is None:
-            return None
-        return _OFFSETS["discard_revealed"] + card_index(action.card)
-    if action.action_type == ActionType.SCUTTLE:
-        if action.card is None or action.target is None:
-            return None
-        attacker_idx = card_index(action.card)
-        target_idx = card_index(action.target)
-        return _OFFSETS["scuttle"] + _pair_index(attacker_idx, target_idx)
-    if action.action_type == ActionType.JACK:
-        if action.card is None or action.target is None:
-            return None
-        attacker_idx = card_index(action.card)
-        target_idx = card_index(action.target)
-        return _OFFSETS["jack"] + _pair_index(attacker_idx, target_idx)
-    return None
+    action_type = action.action_type
+    fixed = _FIXED_INDEX.get(action_type)
+    if fixed is not None:
+        return fixed
+    card = action.card
+    if card is None:
+        return None
+    if action.target is not None:
+        pair_offset = _PAIR_OFFSETS.get(action_type)
+        if pair_offset is not None:
+            return pair_offset + _pair_index(card_index(card), card_index(action.target))
+    card_offset = _CARD_OFFSETS.get(action_type)
+    if card_offset is None:
+        return None
+    return card_offset + card_index(card)
 
 
 def build_action_map(legal_actions: Iterable[Action]) -> Dict[int, Action]:
@@ -124,16 +117,24 @@ def build_action_map(legal_actions: Iterable[Action]) -> Dict[int, Action]:
     return index_to_action
 
 
+def build_action_map_and_mask(
+    legal_actions: Iterable[Action],
+    action_space_size: int = ACTION_SPACE_SIZE,
+) -> Tuple[Dict[int, Action], np.ndarray]:
+    """Build the index-to-Action map and the legal action mask in one pass."""
+    index_to_action = build_action_map(legal_actions)
+    mask = np.zeros(action_space_size, dtype=np.bool_)
+    indices = [idx for idx in index_to_action if 0 <= idx < action_space_size]
+    mask[indices] = True
+    return index_to_action, mask
+
+
 def legal_action_mask_from_actions(
     legal_actions: Iterable[Action],
     action_space_size: int = ACTION_SPACE_SIZE,
 ) -> np.ndarray:
     """Return a boolean mask over the full action space for given legal actions."""
-    mask = np.zeros(action_space_size, dtype=np.bool_)
-    for idx in build_action_map(legal_actions).keys():
-        if 0 <= idx < action_space_size:
-            mask[idx] = True
-    return mask
+    return build_action_map_and_mask(legal_actions, action_space_size)[1]
 
 
 def legal_action_mask(game_state) -> np.ndarray:
@@ -144,7 +145,16 @@ def legal_action_mask(game_state) -> np.ndarray:
     )
 
 
-def action_index_to_action(game_state, action_index: int) -> Optional[Action]:
-    """Resolve a fixed action index into a concrete legal Action, if any."""
-    action_map = build_action_map(game_state.get_legal_actions())
+def action_index_to_action(
+    game_state,
+    action_index: int,
+    action_map: Optional[Dict[int, Action]] = None,
+) -> Optional[Action]:
+    """Resolve a fixed action index into a concrete legal Action, if any.
+
+    Callers that already built the state's action map can pass it to skip
+    enumerating the legal actions again.
+    """
+    if action_map is None:
+        action_map = build_action_map(game_state.get_legal_actions())
     return action_map.get(action_index)
@@ -2,9 +2,55 @@
 from __future__ import annotations
 
 import json
-from collections import Counter, defaultdict
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Below this many logs, starting worker processes costs more than it saves
+_PARALLEL_MIN_FILES = 64
+
+
+def _summarize_game(game_file: Path) -> Dict[str, Any]:
+    """Load one game log and keep only what the analysis reports on.
+
+    Runs in worker processes, so only the small summary is sent back
+    instead of every logged step.
+
+    Args:
+        game_file: Path to a game_*.json log
+
+    Returns:
+        The game id and outcome, a count of each action type, and the
+        action types of the last 20 steps.
+    """
+    with open(game_file, "r") as f:
+        game_data = json.load(f)
+    steps = game_data["steps"]
+    return {
+        "game_id": game_data["game_id"],
+        "outcome": game_data["outcome"],
+        "action_types": Counter(step["action"]["type"] for step in steps),
+        "recent_actions": [s["action"]["type"] for s in steps[-20:]],
+    }
+
+
+def _iter_summaries(game_files: List[Path]) -> Iterator[Dict[str, Any]]:
+    """Yield game summaries in file order, parsing in parallel for large runs.
+
+    Args:
+        game_files: Paths of the game logs to summarize
+
+    Yields:
+        One summary per game, see _summarize_game
+    """
+    if len(game_files) < _PARALLEL_MIN_FILES:
+        for game_file in game_files:
+            yield _summarize_game(game_file)
+        return
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        yield from executor.map(_summarize_game, game_files, chunksize=16)
 
 
 def analyze_logs(log_dir: str = "rl/gameplay_logs") -> None:
@@ -32,38 +78,35 @@ def analyze_logs(log_dir: str = "rl/gameplay_logs") -> None:
     print(f"{'='*70}\n")
     print(f"Analyzing {len(game_files)} games...\n")
     
-    # Collect statistics
+    # Collect statistics, keeping only what the report prints
     action_types = Counter()
-    action_patterns = defaultdict(list)
-    timeout_games = []
+    pattern_counts: Counter[Tuple[str, ...]] = Counter()
+    timeout_count = 0
+    timeout_games: List[Dict[str, Any]] = []  # First 5 only
     quick_wins = []
     
-    for game_file in game_files:
-        with open(game_file, "r") as f:
-            game_data = json.load(f)
-        
-        game_id = game_data["game_id"]
-        steps = game_data["steps"]
-        outcome = game_data["outcome"]
+    for summary in _iter_summaries(game_files):
+        game_id = summary["game_id"]
+        outcome = summary["outcome"]
         
         # Count action types
-        for step in steps:
-            action_type = step["action"]["type"]
-            action_types[action_type] += 1
+        action_types.update(summary["action_types"])
         
         # Detect patterns
-        recent_actions = [s["action"]["type"] for s in steps[-20:]]
-        pattern_key = " -> ".join(recent_actions[-5:]) if len(recent_actions) >= 5 else ""
-        action_patterns[pattern_key].append(game_id)
+        recent_actions = summary["recent_actions"]
+        if len(recent_actions) >= 5:
+            pattern_counts[tuple(recent_actions[-5:])] += 1
         
         # Categorize games
         if outcome["reason"] == "timeout":
-            timeout_games.append({
-                "id": game_id,
-                "steps": outcome["total_steps"],
-                "final_scores": outcome["final_scores"],
-                "recent_actions": recent_actions[-10:],
-            })
+            timeout_count += 1
+            if len(timeout_games) < 5:
+                timeout_games.append({
+                    "id": game_id,
+                    "steps": outcome["total_steps"],
+                    "final_scores": outcome["final_scores"],
+                    "recent_actions": recent_actions[-10:],
+                })
         elif outcome["total_steps"] < 50 and outcome["reason"] == "win":
             quick_wins.append({
                 "id": game_id,
@@ -80,18 +123,18 @@ def analyze_logs(log_dir: str = "rl/gameplay_logs") -> None:
         bar = "█" * int(percentage / 2)
         print(f"  {action_type:20s} {count:5d} ({percentage:5.1f}%) {bar}")
     
-    print(f"\n🔄 TIMEOUT GAMES: {len(timeout_games)}/{len(game_files)}")
+    print(f"\n🔄 TIMEOUT GAMES: {timeout_count}/{len(game_files)}")
     print("-" * 70)
     if timeout_games:
-        for game in timeout_games[:5]:  # Show first 5
+        for game in timeout_games:  # Show first 5
             print(f"\n  Game {game['id']}:")
             print(f"    Steps: {game['steps']}")
             print(f"    Final scores: P0={game['final_scores']['player_0']}, "
                   f"P1={game['final_scores']['player_1']}")
             print(f"    Last 10 actions: {' -> '.join(game['recent_actions'])}")
         
-        if len(timeout_games) > 5:
-            print(f"\n  ... and {len(timeout_games) - 5} more timeout games")
+        if timeout_count > 5:
+            print(f"\n  ... and {timeout_count - 5} more timeout games")
     
     print(f"\n⚡ QUICK WINS: {len(quick_wins)}/{len(game_files)}")
     print("-" * 70)
@@ -102,12 +145,10 @@ def analyze_logs(log_dir: str = "rl/gameplay_logs") -> None:
     # Detect stuck patterns
     print(f"\n🔍 COMMON ACTION PATTERNS (last 5 moves)")
     print("-" * 70)
-    common_patterns = [(p, len(games)) for p, games in action_patterns.items() 
-                      if len(games) > 1 and p]
-    common_patterns.sort(key=lambda x: x[1], reverse=True)
-    
-    for pattern, count in common_patterns[:10]:
-        print(f"  [{count} games] {pattern}")
+    for pattern, count in pattern_counts.most_common(10):
+        if count < 2:
+            break
+        print(f"  [{count} games] {' -> '.join(pattern)}")
     
     # Recommendations
     print(f"\n💡 RECOMMENDATIONS")
@@ -118,7 +159,7 @@ def analyze_logs(log_dir: str = "rl/gameplay_logs") -> None:
         print("  ⚠️  HIGH DRAW RATE: Bot is drawing too often without playing cards")
         print("     Consider adjusting reward to penalize excessive draws")
     
-    if len(timeout_games) / len(game_files) > 0.5:
+    if timeout_count / len(game_files) > 0.5:
         print("  ⚠️  HIGH TIMEOUT RATE: Games are not progressing")
         print("     Bot may not understand how to play for points")
         print("     Consider:")
@@ -2,12 +2,18 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List
 
 import numpy as np
 
+# Below this many experiments, starting worker processes costs more than it saves
+_PARALLEL_MIN_EXPERIMENTS = 4
+
 
 def load_monitor_data(monitor_file: Path) -> Dict[str, Any]:
     """Load data from a stable-baselines3 monitor file.
@@ -16,15 +22,45 @@ def load_monitor_data(monitor_file: Path) -> Dict[str, Any]:
         monitor_file: Path to monitor.csv file
         
     Returns:
-        Dictionary with episode rewards and lengths
+        Dictionary with episode rewards, lengths and times as NumPy arrays
     """
     if not monitor_file.exists():
-        return {"rewards": [], "lengths": [], "times": []}
+        return _empty_monitor_data()
+    
+    # Skip the JSON metadata line and the column header, then parse in C
+    try:
+        with warnings.catch_warnings():
+            # A run that has not finished an episode yet has no data rows
+            warnings.simplefilter("ignore", UserWarning)
+            data = np.loadtxt(
+                monitor_file, delimiter=",", skiprows=2, usecols=(0, 1, 2), ndmin=2
+            )
+    except ValueError:
+        # A malformed row, e.g. a run killed mid-write; skip such rows
+        data = _load_monitor_rows(monitor_file)
     
-    rewards = []
-    lengths = []
-    times = []
+    return {
+        "rewards": data[:, 0],
+        "lengths": data[:, 1].astype(np.int64),
+        "times": data[:, 2],
+    }
+
+
+def _empty_monitor_data() -> Dict[str, Any]:
+    """Return the monitor data of a run that has not logged any episodes."""
+    return {"rewards": np.array([]), "lengths": np.array([], dtype=np.int64), "times": np.array([])}
+
+
+def _load_monitor_rows(monitor_file: Path) -> np.ndarray:
+    """Parse a monitor file line by line, skipping rows that do not parse.
     
+    Args:
+        monitor_file: Path to monitor.csv file
+        
+    Returns:
+        Array of shape (episodes, 3) with reward, length and time columns
+    """
+    rows = []
     with open(monitor_file, "r") as f:
         # Skip header lines
         for _ in range(2):
@@ -36,17 +72,11 @@ def load_monitor_data(monitor_file: Path) -> Dict[str, Any]:
                 parts = line.strip().split(',')
                 if len(parts) >= 3:
                     try:
-                        rewards.append(float(parts[0]))
-                        lengths.append(int(parts[1]))
-                        times.append(float(parts[2]))
+                        rows.append((float(parts[0]), int(parts[1]), float(parts[2])))
                     except ValueError:
                         continue
     
-    return {
-        "rewards": rewards,
-        "lengths": lengths,
-        "times": times,
-    }
+    return np.array(rows, dtype=np.float64).reshape(-1, 3)
 
 
 def analyze_experiment(exp_path: Path) -> Dict[str, Any]:
@@ -58,44 +88,57 @@ def analyze_experiment(exp_path: Path) -> Dict[str, Any]:
     Returns:
         Dictionary with analysis results
     """
+    # List the directory once instead of stat-ing each expected file
+    with os.scandir(exp_path) as entries:
+        names = {entry.name for entry in entries}
+    
     # Load config
-    config_file = exp_path / "config.json"
-    if not config_file.exists():
+    if "config.json" not in names:
         return {"error": "No config.json found"}
     
-    with open(config_file, "r") as f:
+    with open(exp_path / "config.json", "r") as f:
         config = json.load(f)
     
-    # Load training monitor data
-    train_monitor = exp_path / "train.monitor.csv"
-    train_data = load_monitor_data(train_monitor)
-    
-    # Load evaluation monitor data  
-    eval_monitor = exp_path / "eval.monitor.csv"
-    eval_data = load_monitor_data(eval_monitor)
+    # Load training and evaluation monitor data
+    train_data = (
+        load_monitor_data(exp_path / "train.monitor.csv")
+        if "train.monitor.csv" in names
+        else _empty_monitor_data()
+    )
+    eval_data = (
+        load_monitor_data(exp_path / "eval.monitor.csv")
+        if "eval.monitor.csv" in names
+        else _empty_monitor_data()
+    )
     
-    # Calculate statistics
+    # Calculate statistics, reusing each mean for its standard deviation
+    train_rewards = train_data["rewards"]
+    train_lengths = train_data["lengths"]
+    eval_rewards = eval_data["rewards"]
+    eval_lengths = eval_data["lengths"]
+    train_mean = train_rewards.mean() if train_rewards.size else 0.0
+    eval_mean = eval_rewards.mean() if eval_rewards.size else 0.0
     analysis = {
         "name": config["name"],
         "config": config,
         "train": {
-            "total_episodes": len(train_data["rewards"]),
-            "mean_reward": float(np.mean(train_data["rewards"])) if train_data["rewards"] else 0.0,
-            "std_reward": float(np.std(train_data["rewards"])) if train_data["rewards"] else 0.0,
-            "mean_length": float(np.mean(train_data["lengths"])) if train_data["lengths"] else 0.0,
-            "final_100_mean_reward": float(np.mean(train_data["rewards"][-100:])) if len(train_data["rewards"]) >= 100 else 0.0,
+            "total_episodes": int(train_rewards.size),
+            "mean_reward": float(train_mean),
+            "std_reward": float(train_rewards.std(mean=train_mean)) if train_rewards.size else 0.0,
+            "mean_length": float(train_lengths.mean()) if train_lengths.size else 0.0,
+            "final_100_mean_reward": float(train_rewards[-100:].mean()) if train_rewards.size >= 100 else 0.0,
         },
         "eval": {
-            "total_episodes": len(eval_data["rewards"]),
-            "mean_reward": float(np.mean(eval_data["rewards"])) if eval_data["rewards"] else 0.0,
-            "std_reward": float(np.std(eval_data["rewards"])) if eval_data["rewards"] else 0.0,
-            "mean_length": float(np.mean(eval_data["lengths"])) if eval_data["lengths"] else 0.0,
-            "best_reward": float(max(eval_data["rewards"])) if eval_data["rewards"] else 0.0,
+            "total_episodes": int(eval_rewards.size),
+            "mean_reward": float(eval_mean),
+            "std_reward": float(eval_rewards.std(mean=eval_mean)) if eval_rewards.size else 0.0,
+            "mean_length": float(eval_lengths.mean()) if eval_lengths.size else 0.0,
+            "best_reward": float(eval_rewards.max()) if eval_rewards.size else 0.0,
         },
     }
     
     # Check for timeout issues
-    timeout_rate = sum(1 for length in train_data["lengths"] if length >= 200) / max(len(train_data["lengths"]), 1)
+    timeout_rate = np.count_nonzero(train_lengths >= 200) / max(train_lengths.size, 1)
     analysis["train"]["timeout_rate"] = float(timeout_rate)
     
     return analysis
@@ -112,7 +155,13 @@ def compare_experiments(experiments_dir: Path) -> None:
         return
     
     # Find all experiment directories
-    exp_dirs = [d for d in experiments_dir.iterdir() if d.is_dir() and (d / "config.json").exists()]
+    # DirEntry.is_dir() answers from the directory listing without a stat call
+    with os.scandir(experiments_dir) as entries:
+        exp_dirs = [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "config.json"))
+        ]
     
     if not exp_dirs:
         print(f"❌ No experiments found in {experiments_dir}")
@@ -124,11 +173,14 @@ def compare_experiments(experiments_dir: Path) -> None:
     print(f"Found {len(exp_dirs)} experiments\n")
     
     # Analyze all experiments
-    analyses = []
-    for exp_dir in sorted(exp_dirs):
-        analysis = analyze_experiment(exp_dir)
-        if "error" not in analysis:
-            analyses.append(analysis)
+    # Each experiment parses its own monitor files, so they run in parallel
+    exp_dirs.sort()
+    if len(exp_dirs) < _PARALLEL_MIN_EXPERIMENTS:
+        results = [analyze_experiment(exp_dir) for exp_dir in exp_dirs]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(analyze_experiment, exp_dirs))
+    analyses = [analysis for analysis in results if "error" not in analysis]
     
     if not analyses:
         print("❌ No valid experiments to compare")
@@ -1,15 +1,28 @@
 """Gymnasium environment wrapper for Cuttle game with action masking."""
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import gymnasium as gym
 import numpy as np
 
+from game.action import Action
 from game.card import Purpose
 from game.game import Game
-from rl.action_mapping import build_action_map, card_index, legal_action_mask
+from game.game_state import GameState
+from rl.action_mapping import build_action_map, build_action_map_and_mask
 from rl.config import ENV_CONFIG, REWARD_CONFIG
 from rl.game_logger import GameplayLogger
 
+# Offsets of the suit and rank one-hot bits within a card's slot, by Card.index.
+# Index order is rank-major, so rank r and suit s sit at (r - 1) * 4 + s.
+CARD_FEATURE_OFFSETS: Tuple[Tuple[int, int], ...] = tuple(
+    (suit, 4 + rank) for rank in range(13) for suit in range(4)
+)
+
+# Observation layout sizes, read once rather than on every encode
+_OBSERVATION_DIM: int = ENV_CONFIG["observation_dim"]
+_MAX_HAND_SIZE: int = ENV_CONFIG["max_hand_size"]
+_MAX_FIELD_SIZE: int = ENV_CONFIG["max_field_size"]
+
 
 class CuttleRLEnvironment(gym.Env):
     """RL environment for Cuttle card game with action masking support."""
@@ -24,18 +37,32 @@ class CuttleRLEnvironment(gym.Env):
         self.observation_space = gym.spaces.Box(
             low=0.0,
             high=1.0,
-            shape=(ENV_CONFIG["observation_dim"],),
+            shape=(_OBSERVATION_DIM,),
             dtype=np.float32
         )
         
         # Game instance
         self.game: Optional[Game] = None
+        # Legal actions, their index map and mask, with the state they were
+        # computed for; filled by _get_info() or action_masks(), consumed by step()
+        self._legal_cache: Optional[
+            Tuple[GameState, List[Action], Dict[int, Action], np.ndarray]
+        ] = None
         self.current_player = 0
         self.step_count = 0
         self.max_steps = 300  # Increased to allow games to conclude naturally
         self.no_progress_steps = 0
         self.no_progress_limit = 60  # End early if no scoring progress
         
+        # Reward values, read when the environment is created; experiments
+        # patch REWARD_CONFIG before building their environments
+        self._reward_win = REWARD_CONFIG["win"]
+        self._reward_loss = REWARD_CONFIG["loss"]
+        self._reward_stalemate = REWARD_CONFIG["stalemate"]
+        self._reward_progress_multiplier = REWARD_CONFIG["progress_multiplier"]
+        self._reward_turn_penalty = REWARD_CONFIG["turn_penalty"]
+        self._reward_invalid_action = REWARD_CONFIG["invalid_action_penalty"]
+        
         # Logging
         self.logger = GameplayLogger() if enable_logging else None
         self.enable_logging = enable_logging
@@ -48,8 +75,11 @@ class CuttleRLEnvironment(gym.Env):
         """Reset environment to initial state."""
         super().reset(seed=seed)
         
-        # Initialize new game without AI player
-        self.game = Game(manual_selection=False, ai_player=None)
+        # Initialize new game without AI player. Deal from the env's generator
+        # once reset(seed=...) has created it; otherwise Game seeds its own
+        # from the random module.
+        self.game = Game(manual_selection=False, ai_player=None, rng=self._np_random)
+        self._legal_cache = None
         self.current_player = 0
         self.step_count = 0
         self.no_progress_steps = 0
@@ -80,7 +110,27 @@ class CuttleRLEnvironment(gym.Env):
         """
         assert self.game is not None, "Must call reset() first"
         
-        return legal_action_mask(self.game.game_state)
+        return self._current_legal_actions()[3]
+
+    def _current_legal_actions(
+        self,
+    ) -> Tuple[GameState, List[Action], Dict[int, Action], np.ndarray]:
+        """Return the legal actions of the current state, enumerating them once.
+        
+        step() drops the cache before changing the state, so an entry for the
+        current game state is still valid.
+        
+        Returns:
+            The game state, its legal actions, their index map and mask
+        """
+        assert self.game is not None
+        game_state = self.game.game_state
+        cache = self._legal_cache
+        if cache is None or cache[0] is not game_state:
+            legal_actions = game_state.get_legal_actions()
+            action_map, mask = build_action_map_and_mask(legal_actions)
+            cache = self._legal_cache = (game_state, legal_actions, action_map, mask)
+        return cache
 
     def step(
         self, action: int
@@ -103,10 +153,16 @@ class CuttleRLEnvironment(gym.Env):
             )
         
         # Get current legal actions
-        legal_actions = self.game.game_state.get_legal_actions()
+        # Reuse the actions behind the mask MaskablePPO just asked for, unless
+        # the game was swapped out since; the state changes below either way
+        cache, self._legal_cache = self._legal_cache, None
+        if cache is not None and cache[0] is self.game.game_state:
+            _, legal_actions, action_map, _ = cache
+        else:
+            legal_actions = self.game.game_state.get_legal_actions()
+            action_map = build_action_map(legal_actions)
 
         # Decode fixed action index into a concrete legal action
-        action_map = build_action_map(legal_actions)
         chosen_action = action_map.get(action)
 
         # With action masking, invalid actions should never happen
@@ -116,7 +172,7 @@ class CuttleRLEnvironment(gym.Env):
             print("This should not happen with proper action masking!")
             return (
                 self._encode_state(),
-                REWARD_CONFIG["invalid_action_penalty"],
+                self._reward_invalid_action,
                 True,  # done
                 False, # truncated
                 {"error": "invalid_action"}
@@ -168,7 +224,7 @@ class CuttleRLEnvironment(gym.Env):
                 self.logger.end_game(self.game, None, "stall", self.step_count)
             return (
                 self._encode_state(),
-                REWARD_CONFIG["stalemate"],
+                self._reward_stalemate,
                 True,   # done
                 True,   # truncated
                 {"error": "stall", "steps": self.step_count}
@@ -189,68 +245,63 @@ class CuttleRLEnvironment(gym.Env):
         """Encode game state as fixed-size vector."""
         assert self.game is not None
         
-        obs = np.zeros(ENV_CONFIG["observation_dim"], dtype=np.float32)
+        game_state = self.game.game_state
+        obs = np.zeros(_OBSERVATION_DIM, dtype=np.float32)
+        # Positions of the one-hot features, set with a single scatter at the end
+        hot: List[int] = []
+        append = hot.append
         idx = 0
         
         # 1. Current player's hand (136 dims: 8 cards × 17 dims each)
-        hand = self.game.game_state.hands[self.current_player]
-        for i in range(ENV_CONFIG["max_hand_size"]):
-            if i < len(hand):
-                card = hand[i]
-                obs[idx + card.suit.value[1]] = 1.0
-                obs[idx + 4 + card.rank.value[1] - 1] = 1.0
+        hand = game_state.hands[self.current_player]
+        for card in hand[:_MAX_HAND_SIZE]:
+            suit_offset, rank_offset = CARD_FEATURE_OFFSETS[card.index]
+            append(idx + suit_offset)
+            append(idx + rank_offset)
             idx += 17
+        idx += 17 * max(_MAX_HAND_SIZE - len(hand), 0)
         
         # 2. Opponent hand size (1 dim, normalized)
         opponent = 1 - self.current_player
-        obs[idx] = len(self.game.game_state.hands[opponent]) / 8.0
+        obs[idx] = len(game_state.hands[opponent]) / 8.0
         idx += 1
         
-        # 3. Player 0 field cards (180 dims: 10 cards × 18 dims each)
-        for i in range(ENV_CONFIG["max_field_size"]):
-            field = self.game.game_state.get_player_field(0)
-            if i < len(field):
-                card = field[i]
-                obs[idx + card.suit.value[1]] = 1.0
-                obs[idx + 4 + card.rank.value[1] - 1] = 1.0
-                obs[idx + 17] = 1.0 if card.purpose == Purpose.POINTS else 0.0
-            idx += 18
-        
-        # 4. Player 1 field cards (180 dims: same encoding)
-        for i in range(ENV_CONFIG["max_field_size"]):
-            field = self.game.game_state.get_player_field(1)
-            if i < len(field):
-                card = field[i]
-                obs[idx + card.suit.value[1]] = 1.0
-                obs[idx + 4 + card.rank.value[1] - 1] = 1.0
-                obs[idx + 17] = 1.0 if card.purpose == Purpose.POINTS else 0.0
-            idx += 18
+        # 3-4. Player 0 then player 1 field cards (180 dims each: 10 cards × 18 dims)
+        for player in (0, 1):
+            field = game_state.get_player_field(player)
+            for card in field[:_MAX_FIELD_SIZE]:
+                suit_offset, rank_offset = CARD_FEATURE_OFFSETS[card.index]
+                append(idx + suit_offset)
+                append(idx + rank_offset)
+                if card.purpose == Purpose.POINTS:
+                    append(idx + 17)
+                idx += 18
+            idx += 18 * max(_MAX_FIELD_SIZE - len(field), 0)
         
         # 5. Scores and targets (4 dims)
-        obs[idx] = self.game.game_state.get_player_score(0) / 21.0
-        obs[idx + 1] = self.game.game_state.get_player_score(1) / 21.0
-        obs[idx + 2] = self.game.game_state.get_player_target(0) / 21.0
-        obs[idx + 3] = self.game.game_state.get_player_target(1) / 21.0
+        obs[idx] = game_state.get_player_score(0) / 21.0
+        obs[idx + 1] = game_state.get_player_score(1) / 21.0
+        obs[idx + 2] = game_state.get_player_target(0) / 21.0
+        obs[idx + 3] = game_state.get_player_target(1) / 21.0
         idx += 4
         
         # 6. Game state flags (5 dims)
         obs[idx] = float(self.current_player)
-        obs[idx + 1] = 1.0 if self.game.game_state.resolving_one_off else 0.0
-        obs[idx + 2] = 1.0 if self.game.game_state.resolving_three else 0.0
-        obs[idx + 3] = len(self.game.game_state.deck) / 52.0
-        obs[idx + 4] = len(self.game.game_state.discard_pile) / 52.0
+        obs[idx + 1] = 1.0 if game_state.resolving_one_off else 0.0
+        obs[idx + 2] = 1.0 if game_state.resolving_three else 0.0
+        obs[idx + 3] = len(game_state.deck) / 52.0
+        obs[idx + 4] = len(game_state.discard_pile) / 52.0
         idx += 5
 
-        # 7. Discard pile identity (52 dims)
-        for card in self.game.game_state.discard_pile:
-            obs[idx + card_index(card)] = 1.0
+        # 7. Discard pile identity (52 dims), by card_index
+        hot.extend([idx + card.index for card in game_state.discard_pile])
         idx += 52
 
         # 8. Revealed cards for seven (52 dims)
-        for card in self.game.game_state.pending_seven_cards:
-            obs[idx + card_index(card)] = 1.0
+        hot.extend([idx + card.index for card in game_state.pending_seven_cards])
         idx += 52
         
+        obs[hot] = 1.0
         return obs
 
     def _calculate_reward(self, game_ended: bool, winner: Optional[int]) -> float:
@@ -260,11 +311,11 @@ class CuttleRLEnvironment(gym.Env):
         """
         if game_ended:
             if winner == self.current_player:
-                return REWARD_CONFIG["win"]
+                return self._reward_win
             elif winner is not None:
-                return REWARD_CONFIG["loss"]
+                return self._reward_loss
             else:
-                return REWARD_CONFIG["stalemate"]
+                return self._reward_stalemate
         
         # Only reward our own score gains (simpler, less noisy)
         current_score = self.game.game_state.get_player_score(self.current_player)
@@ -275,17 +326,17 @@ class CuttleRLEnvironment(gym.Env):
         
         # Small reward for scoring points
         if score_gain > 0:
-            return score_gain * REWARD_CONFIG["progress_multiplier"]
+            return score_gain * self._reward_progress_multiplier
         
         # Minimal turn penalty otherwise
-        return REWARD_CONFIG["turn_penalty"]
+        return self._reward_turn_penalty
     
     def _get_info(self) -> Dict[str, Any]:
         """Get additional information about game state."""
         assert self.game is not None
         return {
             "current_player": self.current_player,
-            "legal_actions": len(self.game.game_state.get_legal_actions()),
+            "legal_actions": len(self._current_legal_actions()[1]),
             "player_0_score": self.game.game_state.get_player_score(0),
             "player_1_score": self.game.game_state.get_player_score(1),
         }
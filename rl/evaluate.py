@@ -1,12 +1,13 @@
 """Evaluate trained RL agent with action masking."""
 import json
 import os
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 from sb3_contrib import MaskablePPO
 
-from rl.action_mapping import action_index_to_action
+from game.action import Action
+from rl.action_mapping import action_index_to_action, build_action_map
 from rl.config import LOG_DIR, MODEL_DIR
 from rl.cuttle_env import CuttleRLEnvironment
 
@@ -48,13 +49,32 @@ def _snapshot_game_state(env: CuttleRLEnvironment) -> Dict[str, Any]:
     }
 
 
+def _describe_actions(
+    action: Optional[Action], legal_actions: List[Action], enabled: bool
+) -> Dict[str, Any]:
+    """Return the trace fields naming the chosen and legal actions, if enabled."""
+    if not enabled:
+        return {}
+    return {
+        "action": str(action) if action else None,
+        "legal_actions": [str(a) for a in legal_actions],
+    }
+
+
 def play_episode(
     model: MaskablePPO, 
     env: CuttleRLEnvironment, 
     deterministic: bool = True,
     record: bool = False,
+    log_action_strings: bool = True,
 ) -> Tuple[float, int, Optional[int], Optional[Dict[str, Any]]]:
-    """Play one episode with action masking."""
+    """Play one episode with action masking.
+
+    When record is set, log_action_strings controls whether each trace step
+    also names the chosen and legal actions, which needs the legal actions
+    enumerated and decoded again; indices and masks are always recorded.
+    """
+    describe_actions = record and log_action_strings
     obs, info = env.reset()
     done = False
     episode_reward = 0.0
@@ -70,15 +90,18 @@ def play_episode(
             action_masks=action_mask,  # Pass mask to model
             deterministic=deterministic
         )
-        if env.game:
-            action_obj = action_index_to_action(env.game.game_state, int(action))
+        # The decoded action and legal actions only feed the trace
+        if describe_actions and env.game:
             legal_actions = env.game.game_state.get_legal_actions()
+            action_obj = action_index_to_action(
+                env.game.game_state, int(action), build_action_map(legal_actions)
+            )
         else:
             action_obj = None
             legal_actions = []
         state_before = _snapshot_game_state(env) if record else None
 
-        obs, reward, done, truncated, info = env.step(action)
+        obs, reward, done, truncated, info = env.step(int(action))
         state_after = _snapshot_game_state(env) if record else None
         episode_reward += reward
         steps += 1
@@ -91,8 +114,7 @@ def play_episode(
                     "obs": obs_before.tolist(),
                     "next_obs": obs.tolist(),
                     "action_index": int(action),
-                    "action": str(action_obj) if action_obj else None,
-                    "legal_actions": [str(a) for a in legal_actions],
+                    **_describe_actions(action_obj, legal_actions, describe_actions),
                     "action_mask": action_mask.astype(int).tolist(),
                     "reward": float(reward),
                     "done": bool(done),
@@ -112,9 +134,11 @@ def play_episode(
         if len(legal_indices) > 0:
             opp_action = np.random.choice(legal_indices)
             obs_before = obs
-            if env.game:
-                opp_action_obj = action_index_to_action(env.game.game_state, int(opp_action))
+            if describe_actions and env.game:
                 opp_legal_actions = env.game.game_state.get_legal_actions()
+                opp_action_obj = action_index_to_action(
+                    env.game.game_state, int(opp_action), build_action_map(opp_legal_actions)
+                )
             else:
                 opp_action_obj = None
                 opp_legal_actions = []
@@ -133,8 +157,9 @@ def play_episode(
                         "obs": obs_before.tolist(),
                         "next_obs": obs.tolist(),
                         "action_index": int(opp_action),
-                        "action": str(opp_action_obj) if opp_action_obj else None,
-                        "legal_actions": [str(a) for a in opp_legal_actions],
+                        **_describe_actions(
+                            opp_action_obj, opp_legal_actions, describe_actions
+                        ),
                         "action_mask": opponent_mask.astype(int).tolist(),
                         "reward": float(opp_reward),
                         "done": bool(done),
@@ -159,12 +184,96 @@ def play_episode(
     return episode_reward, steps, winner, trace
 
 
+def play_episodes_batched(
+    model: MaskablePPO,
+    n_episodes: int,
+    n_envs: int = 8,
+    deterministic: bool = True,
+    on_episode_end: Optional[Callable[[int], None]] = None,
+) -> List[Tuple[float, int, Optional[int]]]:
+    """Play episodes in several environments, predicting their moves together.
+
+    Each environment plays the same agent-then-random-opponent loop as
+    play_episode, but the agent's moves for all running games go through a
+    single batched model.predict call. A finished game is reset in place
+    until n_episodes have been started.
+
+    Args:
+        model: Trained model choosing the agent's moves
+        n_episodes: Number of episodes to play
+        n_envs: Number of games to run side by side
+        deterministic: Whether the agent plays deterministically
+        on_episode_end: Called with the number of finished episodes each
+            time one ends, e.g. to report progress
+
+    Returns:
+        (episode reward, steps, winner) for each episode, in finishing order
+
+    Raises:
+        ValueError: If n_envs is less than 1
+    """
+    if n_envs < 1:
+        raise ValueError(f"n_envs must be at least 1, got {n_envs}")
+    envs = [CuttleRLEnvironment() for _ in range(min(n_envs, n_episodes))]
+    observations = [env.reset()[0] for env in envs]
+    episode_rewards = [0.0] * len(envs)
+    episode_steps = [0] * len(envs)
+    active = list(range(len(envs)))
+    started = len(envs)
+    results: List[Tuple[float, int, Optional[int]]] = []
+
+    while active:
+        # Agent's turn in every running game, as one batched prediction
+        actions, _ = model.predict(
+            np.stack([observations[slot] for slot in active]),
+            action_masks=np.stack([envs[slot].action_masks() for slot in active]),
+            deterministic=deterministic,
+        )
+        still_active = []
+        for slot, action in zip(active, actions):
+            env = envs[slot]
+            obs, reward, done, _, _ = env.step(int(action))
+            episode_rewards[slot] += reward
+            episode_steps[slot] += 1
+
+            if not done:
+                # Random opponent's turn (also uses masking)
+                legal_indices = np.where(env.action_masks())[0]
+                if len(legal_indices) > 0:
+                    opp_action = np.random.choice(legal_indices)
+                    obs, opp_reward, done, _, _ = env.step(opp_action)
+                    episode_rewards[slot] -= opp_reward
+                    episode_steps[slot] += 1
+
+            if done:
+                winner = env.game.game_state.winner() if env.game else None
+                results.append((episode_rewards[slot], episode_steps[slot], winner))
+                if on_episode_end is not None:
+                    on_episode_end(len(results))
+                if started == n_episodes:
+                    continue
+                obs, _ = env.reset()
+                episode_rewards[slot] = 0.0
+                episode_steps[slot] = 0
+                started += 1
+            observations[slot] = obs
+            still_active.append(slot)
+        active = still_active
+
+    return results
+
+
 def evaluate_agent(
     model_path: str,
     n_episodes: int = 100,
     record_path: Optional[str] = None,
+    n_envs: int = 8,
 ):
-    """Evaluate agent over multiple episodes."""
+    """Evaluate agent over multiple episodes.
+
+    The first episode is played on its own when it is being recorded; the
+    rest run n_envs at a time with batched predictions.
+    """
     print(f"Loading MaskablePPO model from: {model_path}")
     model = MaskablePPO.load(model_path)
     
@@ -180,15 +289,36 @@ def evaluate_agent(
     invalid_actions = 0
     
     print(f"Running {n_episodes} evaluation episodes with action masking...")
-    for episode in range(n_episodes):
-        if (episode + 1) % 10 == 0:
-            print(f"  Episode {episode + 1}/{n_episodes}")
-        
-        record = record_path is not None and episode == 0
+    results: List[Tuple[float, int, Optional[int]]] = []
+    if record_path is not None and n_episodes > 0:
         episode_reward, steps, winner, trace = play_episode(
-            model, env, deterministic=True, record=record
+            model, env, deterministic=True, record=True
         )
-        
+        results.append((episode_reward, steps, winner))
+        if trace is not None:
+            os.makedirs(os.path.dirname(record_path), exist_ok=True)
+            with open(record_path, "w", encoding="utf-8") as handle:
+                json.dump(trace, handle, indent=2)
+            print(f"Saved episode trace to: {record_path}")
+
+    recorded = len(results)
+
+    def report_progress(finished: int) -> None:
+        episode = recorded + finished
+        if episode % 10 == 0:
+            print(f"  Episode {episode}/{n_episodes}")
+
+    results.extend(
+        play_episodes_batched(
+            model,
+            n_episodes - recorded,
+            n_envs=n_envs,
+            deterministic=True,
+            on_episode_end=report_progress,
+        )
+    )
+
+    for episode_reward, steps, winner in results:
         # Record results
         total_rewards.append(episode_reward)
         episode_lengths.append(steps)
@@ -200,12 +330,6 @@ def evaluate_agent(
             losses += 1
         else:
             stalemates += 1
-
-        if record and trace is not None:
-            os.makedirs(os.path.dirname(record_path), exist_ok=True)
-            with open(record_path, "w", encoding="utf-8") as handle:
-                json.dump(trace, handle, indent=2)
-            print(f"Saved episode trace to: {record_path}")
     
     # Print results
     print("\n" + "=" * 50)
@@ -39,7 +39,8 @@ def _get_rl_player() -> AIPlayerProtocol:
     if RLPlayer is None:
         raise ValueError("RL AI is not available")
     if _rl_player_singleton is None:
-        _rl_player_singleton = RLPlayer()
+        # One player serves every session, so batch their predictions
+        _rl_player_singleton = RLPlayer(batched=True)
     return _rl_player_singleton
 
 
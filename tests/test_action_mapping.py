@@ -1,10 +1,13 @@
 """Sanity checks for fixed action mapping."""
-from game.game import Game
+from game.card import Card
+from game.game import CARD_TEMPLATES, Game
 from rl.action_mapping import (
     ACTION_SPACE_SIZE,
     action_index_to_action,
     action_to_index,
     build_action_map,
+    build_action_map_and_mask,
+    card_index,
     legal_action_mask_from_actions,
 )
 
@@ -26,8 +29,27 @@ def test_action_mask_roundtrip() -> None:
         decoded = action_index_to_action(state, idx)
         assert decoded is not None
         assert action_to_index(decoded) == idx
+        assert action_index_to_action(state, idx, action_map) is action
 
     for action in legal_actions:
         idx = action_to_index(action)
         assert idx is not None
         assert mask[idx]
+
+
+def test_card_index_matches_rank_and_suit() -> None:
+    """card_index keeps the rank-major, suit-minor layout of the action space."""
+    for card in (Card(*template) for template in CARD_TEMPLATES):
+        assert card_index(card) == (card.rank.value[1] - 1) * 4 + card.suit.value[1]
+
+
+def test_build_action_map_and_mask_agree() -> None:
+    """The fused builder matches the separate map and mask helpers."""
+    game = Game(manual_selection=False, ai_player=None)
+    legal_actions = game.game_state.get_legal_actions()
+
+    action_map, mask = build_action_map_and_mask(legal_actions)
+
+    assert action_map == build_action_map(legal_actions)
+    assert (mask == legal_action_mask_from_actions(legal_actions)).all()
+    assert sorted(action_map) == mask.nonzero()[0].tolist()
@@ -1,7 +1,7 @@
 import asyncio
 import unittest
 from typing import List
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -62,21 +62,50 @@ class TestAIPlayer(unittest.IsolatedAsyncioTestCase):
         self.assertIn("Play Five of Clubs as points", formatted_state)
 
     @pytest.mark.timeout(10)
-    @patch("ollama.chat")
+    async def test_get_action_no_legal_actions(self) -> None:
+        """Test handling of empty legal actions list."""
+        with self.assertRaises(ValueError):
+            await self.ai_player.get_action(self.game_state, [])
+
+    def test_set_model(self) -> None:
+        """Test model setting functionality."""
+        test_model: str = "llama2"
+        self.ai_player.set_model(test_model)
+        self.assertEqual(self.ai_player.model, test_model)
+
+
+class TestAIPlayerWithoutServer(unittest.IsolatedAsyncioTestCase):
+    """AIPlayer tests that mock every Ollama call, so no server is needed."""
+
+    ai_player: AIPlayer
+    p1_cards: List[Card]
+    game_state: GameState
+
+    def setUp(self) -> None:
+        with patch.object(AIPlayer, "_verify_ai_understanding"):
+            self.ai_player = AIPlayer(retry_delay=0, max_retries=1)
+        self.p1_cards = [
+            Card("3", Suit.DIAMONDS, Rank.QUEEN),
+            Card("4", Suit.CLUBS, Rank.FIVE),
+        ]
+        self.game_state = GameState(
+            hands=[[Card("1", Suit.HEARTS, Rank.KING)], self.p1_cards],
+            fields=[[], []],
+            deck=[Card("5", Suit.HEARTS, Rank.TWO)],
+            discard_pile=[],
+        )
+
+    @pytest.mark.timeout(10)
+    @patch("ollama.AsyncClient.generate", new_callable=AsyncMock)
     @patch("game.ai_player.AIPlayer._format_game_state")
-    async def test_get_action_success(self, mock_format_game_state: Mock, mock_chat: Mock) -> None:
+    async def test_get_action_success(self, mock_format_game_state: Mock, mock_generate: AsyncMock) -> None:
         """Test successful action selection by AI."""
         legal_actions: List[Action] = [
             Action(action_type=ActionType.DRAW, card=None, target=None, played_by=1),
             Action(action_type=ActionType.POINTS, card=self.p1_cards[1], target=None, played_by=1),
         ]
 
-        mock_chat.return_value = {
-            'message': {
-                'content': "I choose to play Five of Clubs as points to start building my score. Action number: 1",
-                'role': 'assistant'
-            }
-        }
+        mock_generate.return_value = {"response": " 1"}
 
         mock_format_game_state.return_value = "mock game state"
 
@@ -89,21 +118,16 @@ class TestAIPlayer(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(action.card, self.p1_cards[1])
 
     @pytest.mark.timeout(10)
-    @patch("ollama.chat")
+    @patch("ollama.AsyncClient.generate", new_callable=AsyncMock)
     @patch("game.ai_player.AIPlayer._format_game_state")
-    async def test_get_action_invalid_response(self, mock_format_game_state: Mock, mock_chat: Mock) -> None:
+    async def test_get_action_invalid_response(self, mock_format_game_state: Mock, mock_generate: AsyncMock) -> None:
         """Test handling of invalid LLM response."""
         legal_actions: List[Action] = [
             Action(action_type=ActionType.DRAW, card=None, target=None, played_by=1),
             Action(action_type=ActionType.POINTS, card=self.p1_cards[1], target=None, played_by=1),
         ]
 
-        mock_chat.return_value = {
-            'message': {
-                'content': "I am not sure what to do.",
-                'role': 'assistant'
-            }
-        }
+        mock_generate.return_value = {"response": " I am not sure what to do."}
 
         mock_format_game_state.return_value = "mock game state"
 
@@ -115,8 +139,29 @@ class TestAIPlayer(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(action.action_type, ActionType.DRAW)
 
     @pytest.mark.timeout(10)
-    @patch("ollama.chat")
-    async def test_get_action_api_error(self, mock_chat: Mock) -> None:
+    @patch("ollama.AsyncClient.generate", new_callable=AsyncMock)
+    @patch("game.ai_player.AIPlayer._format_game_state")
+    async def test_get_action_reuses_game_context(self, mock_format_game_state: Mock, mock_generate: AsyncMock) -> None:
+        """Test that the rules are prefilled once and reused as context."""
+        legal_actions: List[Action] = [
+            Action(action_type=ActionType.DRAW, card=None, target=None, played_by=1),
+            Action(action_type=ActionType.POINTS, card=self.p1_cards[1], target=None, played_by=1),
+        ]
+        mock_generate.return_value = {"response": " 1", "context": [1, 2, 3]}
+        mock_format_game_state.return_value = "mock game state"
+
+        await self.ai_player.get_action(self.game_state, legal_actions)
+        await self.ai_player.get_action(self.game_state, legal_actions)
+
+        # One call builds the context, then one call per decision
+        self.assertEqual(mock_generate.call_count, 3)
+        last_call = mock_generate.call_args.kwargs
+        self.assertEqual(last_call["context"], [1, 2, 3])
+        self.assertEqual(last_call["system"], "")
+
+    @pytest.mark.timeout(10)
+    @patch("ollama.AsyncClient.generate", new_callable=AsyncMock)
+    async def test_get_action_api_error(self, mock_generate: AsyncMock) -> None:
         """Test handling of API errors."""
         legal_actions: List[Action] = [
             Action(action_type=ActionType.DRAW, card=None, target=None, played_by=1),
@@ -124,7 +169,7 @@ class TestAIPlayer(unittest.IsolatedAsyncioTestCase):
         ]
 
         # Mock API error
-        mock_chat.side_effect = Exception("API Error")
+        mock_generate.side_effect = Exception("API Error")
 
         # Get AI action - should default to first legal action
         action = await self.ai_player.get_action(self.game_state, legal_actions)
@@ -134,13 +179,64 @@ class TestAIPlayer(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(action.action_type, ActionType.DRAW)
 
     @pytest.mark.timeout(10)
-    async def test_get_action_no_legal_actions(self) -> None:
-        """Test handling of empty legal actions list."""
-        with self.assertRaises(ValueError):
-            await self.ai_player.get_action(self.game_state, [])
+    @patch("ollama.chat")
+    def test_choose_card_from_discard_is_cached(self, mock_chat: Mock) -> None:
+        """Test that a repeated discard pile is answered without another LLM call."""
+        discard_pile: List[Card] = [
+            Card("7", Suit.HEARTS, Rank.NINE),
+            Card("8", Suit.CLUBS, Rank.KING),
+        ]
+        mock_chat.return_value = MagicMock(message=MagicMock(content="Choice: 1"))
 
-    def test_set_model(self) -> None:
-        """Test model setting functionality."""
-        test_model: str = "llama2"
-        self.ai_player.set_model(test_model)
-        self.assertEqual(self.ai_player.model, test_model)
+        first = self.ai_player.choose_card_from_discard(discard_pile)
+        second = self.ai_player.choose_card_from_discard(list(reversed(discard_pile)))
+
+        self.assertIs(first, discard_pile[1])
+        self.assertIs(second, discard_pile[1])
+        self.assertEqual(mock_chat.call_count, 1)
+
+    @pytest.mark.timeout(10)
+    @patch("ollama.AsyncClient.generate", new_callable=AsyncMock)
+    @patch("game.ai_player.AIPlayer._format_game_state")
+    async def test_get_action_retry_varies_sampling(self, mock_format_game_state: Mock, mock_generate: AsyncMock) -> None:
+        """Test that a retry raises the temperature and changes the seed."""
+        legal_actions: List[Action] = [
+            Action(action_type=ActionType.DRAW, card=None, target=None, played_by=1),
+            Action(action_type=ActionType.POINTS, card=self.p1_cards[1], target=None, played_by=1),
+        ]
+        self.ai_player.max_retries = 2
+        # The first call builds the context, then two attempts follow
+        mock_generate.side_effect = [
+            {"response": "OK"},
+            {"response": " I am not sure what to do."},
+            {"response": " 1"},
+        ]
+        mock_format_game_state.return_value = "mock game state"
+
+        action = await self.ai_player.get_action(self.game_state, legal_actions)
+
+        self.assertEqual(action, legal_actions[1])
+        first_options = mock_generate.call_args_list[1].kwargs["options"]
+        retry_options = mock_generate.call_args_list[2].kwargs["options"]
+        self.assertEqual(first_options, AIPlayer.GENERATE_OPTIONS)
+        self.assertGreater(retry_options["temperature"], first_options["temperature"])
+        self.assertNotEqual(retry_options.get("seed"), first_options.get("seed"))
+        self.assertEqual(retry_options["num_predict"], first_options["num_predict"])
+
+    @pytest.mark.timeout(10)
+    @patch("ollama.AsyncClient.generate", new_callable=AsyncMock)
+    @patch("game.ai_player.AIPlayer._format_game_state")
+    async def test_get_action_clamps_out_of_range_choice(self, mock_format_game_state: Mock, mock_generate: AsyncMock) -> None:
+        """Test that an out-of-range choice picks the last legal action."""
+        legal_actions: List[Action] = [
+            Action(action_type=ActionType.DRAW, card=None, target=None, played_by=1),
+            Action(action_type=ActionType.POINTS, card=self.p1_cards[1], target=None, played_by=1),
+        ]
+        mock_generate.return_value = {"response": " 99"}
+        mock_format_game_state.return_value = "mock game state"
+
+        action = await self.ai_player.get_action(self.game_state, legal_actions)
+
+        self.assertIs(action, legal_actions[-1])
+        # Clamping avoids a retry: one context call and one decision
+        self.assertEqual(mock_generate.call_count, 2)
@@ -1,3 +1,4 @@
+import random
 import unittest
 from typing import Any, Dict, List
 from unittest.mock import Mock, patch
@@ -165,6 +166,35 @@ class TestGame(unittest.TestCase):
         unique_cards = set(str(card) for card in cards)
         self.assertEqual(len(cards), len(unique_cards))
 
+    @pytest.mark.timeout(5)
+    def test_generate_shuffled_deck(self) -> None:
+        """Test that each shuffled deck is complete and uses fresh cards."""
+        game = Game()
+        first = game.generate_shuffled_deck()
+        second = game.generate_shuffled_deck()
+
+        self.assertEqual(len(first), 52)
+        self.assertEqual({card.id for card in first}, {str(i) for i in range(52)})
+        self.assertTrue(all(isinstance(card.id, str) for card in first))
+        # Cards are mutable, so decks must never share instances
+        second_ids = {id(card) for card in second}
+        self.assertFalse(any(id(card) in second_ids for card in first))
+
+    @pytest.mark.timeout(5)
+    def test_seeded_games_deal_the_same_cards(self) -> None:
+        """Test that a seed or the global random state fixes the deal."""
+
+        def deal(game: Game) -> List[str]:
+            state = game.game_state
+            return [str(card) for card in state.hands[0] + state.hands[1] + state.deck]
+
+        self.assertEqual(deal(Game(rng=7)), deal(Game(rng=7)))
+        self.assertNotEqual(deal(Game(rng=7)), deal(Game(rng=8)))
+        random.seed(7)
+        first = deal(Game())
+        random.seed(7)
+        self.assertEqual(first, deal(Game()))
+
     @pytest.mark.timeout(5)
     def test_fill_remaining_slots(self) -> None:
         """Test that fill_remaining_slots correctly fills partial hands."""
@@ -1,5 +1,8 @@
+import contextlib
+import copy
+import io
 import unittest
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from game.action import Action, ActionType
 from game.card import Card, Purpose, Rank, Suit
@@ -34,12 +37,79 @@ class TestGameState(unittest.TestCase):
         self.assertEqual(self.game_state.deck, self.deck)
         self.assertEqual(self.game_state.discard_pile, self.discard_pile)
 
+    def test_uses_slots(self) -> None:
+        # Search code clones states and cards heavily; keep them dict-free
+        self.assertFalse(hasattr(self.game_state, "__dict__"))
+        self.assertFalse(hasattr(self.deck[0], "__dict__"))
+        self.assertFalse(hasattr(Action(ActionType.DRAW, 0), "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.game_state.scores = [0, 0]  # type: ignore[attr-defined]
+
     def test_next_turn(self) -> None:
         self.game_state.next_turn()
         self.assertEqual(self.game_state.turn, 1)
         self.game_state.next_turn()
         self.assertEqual(self.game_state.turn, 0)
 
+    def test_clone_is_independent(self) -> None:
+        clone = self.game_state.clone()
+        clone.hands[0].pop()
+        clone.deck[0].purpose = Purpose.POINTS
+        clone.next_turn()
+        self.assertEqual(len(self.game_state.hands[0]), 5)
+        self.assertIsNone(self.game_state.deck[0].purpose)
+        self.assertEqual(self.game_state.turn, 0)
+        self.assertIs(clone.logger, self.game_state.logger)
+        self.assertEqual(len(clone.game_history), 0)
+
+    def test_clone_preserves_card_references(self) -> None:
+        stolen = Card("s", Suit.SPADES, Rank.NINE, played_by=1, purpose=Purpose.POINTS)
+        jack = Card("j", Suit.CLUBS, Rank.JACK, played_by=0, purpose=Purpose.JACK)
+        stolen.attachments.append(jack)
+        self.fields[1].append(stolen)
+        self.game_state.one_off_card_to_counter = self.hands[0][0]
+
+        memo: Dict[int, Any] = {}
+        clone = self.game_state.clone(memo)
+        for slot in GameState.__slots__:
+            self.assertTrue(hasattr(clone, slot), slot)
+
+        cloned_stolen = clone.fields[1][0]
+        self.assertIsNot(cloned_stolen, stolen)
+        self.assertTrue(cloned_stolen.is_stolen())
+        self.assertIsNot(cloned_stolen.attachments[0], jack)
+        self.assertIs(clone.one_off_card_to_counter, clone.hands[0][0])
+        # Actions copied with the same memo refer to the clone's cards
+        action = Action(ActionType.SCUTTLE, 0, card=self.hands[0][1], target=stolen)
+        cloned_action = copy.deepcopy(action, memo)
+        self.assertIs(cloned_action.card, clone.hands[0][1])
+        self.assertIs(cloned_action.target, cloned_stolen)
+
+    def test_legal_actions_are_reused(self) -> None:
+        first = self.game_state.get_legal_actions()
+        second = self.game_state.get_legal_actions()
+        self.assertEqual(len(first), len(second))
+        for action, again in zip(first, second):
+            if action.action_type in (ActionType.DRAW, ActionType.POINTS):
+                self.assertIs(action, again)
+        # A clone builds its own actions for its own cards
+        clone_actions = self.game_state.clone().get_legal_actions()
+        points = [a for a in clone_actions if a.action_type == ActionType.POINTS]
+        self.assertTrue(points)
+        self.assertTrue(all(a.card not in self.hands[0] for a in points))
+
+    def test_zobrist_hash(self) -> None:
+        clone = self.game_state.clone()
+        self.assertEqual(clone.zobrist_hash(), self.game_state.zobrist_hash())
+        # Hand order does not matter, card locations and turn do
+        clone.hands[0].reverse()
+        self.assertEqual(clone.zobrist_hash(), self.game_state.zobrist_hash())
+        clone.next_turn()
+        self.assertNotEqual(clone.zobrist_hash(), self.game_state.zobrist_hash())
+        clone.next_turn()
+        clone.hands[0].append(clone.deck.pop())
+        self.assertNotEqual(clone.zobrist_hash(), self.game_state.zobrist_hash())
+
     def test_get_player_score(self) -> None:
         self.assertEqual(self.game_state.get_player_score(0), 0)
         self.assertEqual(self.game_state.get_player_score(1), 0)
@@ -73,8 +143,44 @@ class TestGameState(unittest.TestCase):
     def test_winner(self) -> None:
         self.assertIsNone(self.game_state.winner())
 
+    def test_scores_and_targets(self) -> None:
+        self.fields[0].append(Card("", Suit.HEARTS, Rank.KING, played_by=0))
+        self.fields[0].append(
+            Card("", Suit.SPADES, Rank.SEVEN, purpose=Purpose.POINTS, played_by=0)
+        )
+        self.fields[1].append(
+            Card("", Suit.CLUBS, Rank.FOUR, purpose=Purpose.POINTS, played_by=1)
+        )
+        scores, targets = self.game_state.scores_and_targets()
+        self.assertEqual(
+            scores, [self.game_state.get_player_score(p) for p in range(2)]
+        )
+        self.assertEqual(
+            targets, [self.game_state.get_player_target(p) for p in range(2)]
+        )
+        self.assertEqual((scores, targets), ([7, 4], [14, 21]))
+
+    def test_winner_counts_stolen_points(self) -> None:
+        stolen = Card("", Suit.SPADES, Rank.NINE, purpose=Purpose.POINTS, played_by=0)
+        stolen.attachments.append(Card("", Suit.CLUBS, Rank.JACK, played_by=1))
+        self.fields[0].append(stolen)
+        self.fields[1].append(
+            Card("", Suit.DIAMONDS, Rank.FIVE, purpose=Purpose.POINTS, played_by=1)
+        )
+        self.assertIsNone(self.game_state.winner())
+        self.fields[1].append(Card("", Suit.DIAMONDS, Rank.KING, played_by=1))
+        self.assertEqual(self.game_state.winner(), 1)
+
     def test_is_stalemate(self) -> None:
         self.assertFalse(self.game_state.is_stalemate())
+        self.game_state.deck.clear()
+        self.assertTrue(self.game_state.is_stalemate())
+        # A win by player 0 with an empty deck is not a stalemate
+        self.fields[0].extend(
+            Card("", Suit.HEARTS, Rank.KING, played_by=0) for _ in range(4)
+        )
+        self.assertEqual(self.game_state.winner(), 0)
+        self.assertFalse(self.game_state.is_stalemate())
 
     def test_draw_card(self) -> None:
         self.game_state.draw_card()
@@ -98,6 +204,22 @@ class TestGameState(unittest.TestCase):
         self.assertIn(card, self.game_state.fields[0])
         self.assertNotIn(card, self.game_state.hands[0])
 
+    def test_win_is_silent_unless_verbose(self) -> None:
+        self.game_state.fields[0].extend(
+            Card(str(i), Suit.HEARTS, Rank.TEN, played_by=0, purpose=Purpose.POINTS)
+            for i in range(2)
+        )
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertTrue(self.game_state.play_points(self.hands[0][0]))
+        self.assertEqual(out.getvalue(), "")
+
+        self.addCleanup(setattr, GameState, "VERBOSE", False)
+        GameState.VERBOSE = True
+        with contextlib.redirect_stdout(out):
+            self.assertTrue(self.game_state.play_points(self.hands[0][0]))
+        self.assertIn("Player 0 wins!", out.getvalue())
+
     def test_scuttle(self) -> None:
         card: Card = self.hands[0][0]
         target: Card = Card(
@@ -144,9 +266,10 @@ class TestGameState(unittest.TestCase):
         stolen_target = Card(
             "target", Suit.CLUBS, Rank.SEVEN, played_by=0, purpose=Purpose.POINTS
         )
-        stolen_target.attachments.append(
-            Card("jack", Suit.HEARTS, Rank.JACK, played_by=1, purpose=Purpose.JACK)
+        stolen_target_jack = Card(
+            "jack", Suit.HEARTS, Rank.JACK, played_by=1, purpose=Purpose.JACK
         )
+        stolen_target.attachments.append(stolen_target_jack)
         fields: List[List[Card]] = [[stolen_target], []]
         game_state = GameState(hands, fields, [], [])
 
@@ -162,6 +285,9 @@ class TestGameState(unittest.TestCase):
         game_state.scuttle(scuttle_card, stolen_target)
         self.assertIn(stolen_target, game_state.discard_pile)
         self.assertIn(scuttle_card, game_state.discard_pile)
+        self.assertIn(stolen_target_jack, game_state.discard_pile)
+        self.assertEqual(stolen_target.attachments, [])
+        self.assertFalse(stolen_target.is_stolen())
 
     def test_play_one_off(self) -> None:
         counter_card: Card = Card(
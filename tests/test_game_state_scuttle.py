@@ -140,6 +140,17 @@ class TestGameStateScuttle(unittest.TestCase):
             "Seven of Clubs should not be able to scuttle Seven of Hearts (lower suit)",
         )
 
+    def test_card_beats_matches_scuttle_rule(self) -> None:
+        """Test that Card.beats orders cards by point value, then suit."""
+        cards = [Card("", suit, rank) for rank in Rank for suit in Suit]
+        for card in cards:
+            for other in cards:
+                expected = card.point_value() > other.point_value() or (
+                    card.point_value() == other.point_value()
+                    and card.suit_value() > other.suit_value()
+                )
+                self.assertEqual(card.beats(other), expected)
+
     def test_scuttle_with_lower_value_not_allowed(self) -> None:
         """Test that lower value cards cannot scuttle."""
         # Add a Four of Hearts to P0's hand
@@ -9,7 +9,7 @@ import unittest
 from typing import Any, List, Tuple
 from unittest.mock import Mock, patch
 
-from game.input_handler import get_interactive_input
+from game.input_handler import display_options, get_interactive_input
 
 
 class TestInputHandler(unittest.TestCase):
@@ -225,6 +225,25 @@ class TestInputHandler(unittest.TestCase):
         with self.assertRaises(KeyboardInterrupt):
             get_interactive_input("Select a card:", self.test_options)
 
+    @patch("game.input_handler.is_interactive_terminal", return_value=True)
+    def test_display_options_single_write(self, mock_is_interactive: Mock) -> None:
+        """Test that a redraw reaches the terminal in one write"""
+        with patch("sys.stdout") as mock_stdout:
+            display_options(
+                "Select a card:",
+                "k",
+                self.test_options,
+                self.test_options[:2],
+                0,
+                10,
+                40,
+            )
+        mock_stdout.write.assert_called_once()
+        frame = mock_stdout.write.call_args.args[0]
+        self.assertTrue(frame.startswith("\033[F\033[K" * 5))
+        self.assertIn("→ 0: King of Hearts\n", frame)
+        self.assertIn("  1: King of Diamonds\n", frame)
+
     def test_non_interactive_terminal(self) -> None:
         """Test fallback behavior for non-interactive terminals"""
         # Test selecting by index
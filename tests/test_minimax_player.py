@@ -0,0 +1,126 @@
+import contextlib
+import io
+import time
+import unittest
+from typing import List
+
+from game.action import ActionType
+from game.card import Card, Purpose, Rank, Suit
+from game.game_state import GameState
+from game.minimax_player import MinimaxPlayer
+
+
+class TestMinimaxPlayer(unittest.TestCase):
+    def setUp(self) -> None:
+        ten = Card("1", Suit.HEARTS, Rank.TEN, played_by=0, purpose=Purpose.POINTS)
+        nine = Card("2", Suit.SPADES, Rank.NINE, played_by=0, purpose=Purpose.POINTS)
+        self.game_state = GameState(
+            hands=[
+                [Card("3", Suit.CLUBS, Rank.TWO), Card("4", Suit.CLUBS, Rank.ACE)],
+                [Card("5", Suit.DIAMONDS, Rank.THREE), Card("6", Suit.HEARTS, Rank.FIVE)],
+            ],
+            fields=[[ten, nine], []],
+            deck=[Card(str(i), Suit.SPADES, Rank.SIX) for i in range(10, 20)],
+            discard_pile=[],
+            input_mode="api",
+        )
+        self.player = MinimaxPlayer(depth=2)
+
+    def test_takes_winning_move(self) -> None:
+        legal_actions = self.game_state.get_legal_actions()
+        action = self.player.get_action_sync(self.game_state, legal_actions)
+        self.assertEqual(action.action_type, ActionType.POINTS)
+        self.assertIs(action.card, self.game_state.hands[0][0])
+        self.assertGreater(self.player.nodes_searched, 0)
+
+    def test_search_does_not_modify_game_state(self) -> None:
+        legal_actions = self.game_state.get_legal_actions()
+        hands_before = [list(hand) for hand in self.game_state.hands]
+        deck_before = list(self.game_state.deck)
+        self.player.get_action_sync(self.game_state, legal_actions)
+        self.assertEqual(self.game_state.hands, hands_before)
+        self.assertEqual(self.game_state.deck, deck_before)
+        self.assertEqual(self.game_state.get_player_score(0), 19)
+        self.assertEqual(self.game_state.turn, 0)
+
+    def test_single_legal_action_is_returned(self) -> None:
+        legal_actions = self.game_state.get_legal_actions()[:1]
+        self.assertIs(
+            self.player.get_action_sync(self.game_state, legal_actions),
+            legal_actions[0],
+        )
+
+    def test_transposition_table_is_filled_and_reused(self) -> None:
+        self.game_state.fields[0].clear()
+        legal_actions = self.game_state.get_legal_actions()
+        player = MinimaxPlayer(depth=3)
+        first = player.get_action_sync(self.game_state, legal_actions)
+        self.assertGreater(len(player._tt), 0)
+        first_nodes = player.nodes_searched
+        second = player.get_action_sync(self.game_state, legal_actions)
+        self.assertIs(first, second)
+        self.assertLess(player.nodes_searched, first_nodes)
+
+    def test_transposition_table_is_not_reused_for_another_deal(self) -> None:
+        def deal(deck_ranks: List[Rank]) -> GameState:
+            return GameState(
+                hands=[
+                    [Card("1", Suit.CLUBS, Rank.TWO), Card("2", Suit.CLUBS, Rank.ACE)],
+                    [Card("3", Suit.DIAMONDS, Rank.THREE), Card("4", Suit.HEARTS, Rank.FIVE)],
+                ],
+                fields=[[], []],
+                deck=[
+                    Card(str(10 + i), Suit.SPADES, rank)
+                    for i, rank in enumerate(deck_ranks)
+                ],
+                discard_pile=[],
+                input_mode="api",
+            )
+
+        ranks = [Rank.SIX, Rank.KING, Rank.NINE, Rank.EIGHT, Rank.TEN, Rank.FOUR]
+        first = deal(ranks)
+        # Same zones, but the cards come off the deck in a different order
+        second = deal(ranks[::-1])
+        self.assertEqual(first.zobrist_hash(), second.zobrist_hash())
+
+        player = MinimaxPlayer(depth=3)
+        player.get_action_sync(first, first.get_legal_actions())
+        action = player.get_action_sync(second, second.get_legal_actions())
+
+        fresh = MinimaxPlayer(depth=3)
+        expected = fresh.get_action_sync(second, second.get_legal_actions())
+        self.assertIs(action, expected)
+        self.assertEqual(player.nodes_searched, fresh.nodes_searched)
+
+    def test_time_budget_stops_iterative_deepening(self) -> None:
+        self.game_state.fields[0].clear()
+        legal_actions = self.game_state.get_legal_actions()
+        player = MinimaxPlayer(depth=50, time_budget=0.05)
+        start = time.monotonic()
+        action = player.get_action_sync(self.game_state, legal_actions)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertIn(action, legal_actions)
+        self.assertGreaterEqual(player.depth_reached, 1)
+        self.assertLess(player.depth_reached, 50)
+
+    def test_search_prints_nothing(self) -> None:
+        # A Three with an empty discard pile used to print during search
+        self.game_state.fields[0].clear()
+        self.game_state.hands[0].append(Card("7", Suit.SPADES, Rank.THREE))
+        legal_actions = self.game_state.get_legal_actions()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.player.get_action_sync(self.game_state, legal_actions)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_no_legal_actions(self) -> None:
+        with self.assertRaises(ValueError):
+            self.player.get_action_sync(self.game_state, [])
+
+    def test_invalid_depth(self) -> None:
+        with self.assertRaises(ValueError):
+            MinimaxPlayer(depth=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
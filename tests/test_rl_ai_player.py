@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+import unittest
+from typing import List, Tuple
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from game.action import Action
+from game.game import Game
+from game.game_state import GameState
+from game.rl_ai_player import BatchedRLAIPlayer, RLAIPlayer
+
+
+def _last_legal_index(
+    observations: np.ndarray, action_masks: np.ndarray, **_: object
+) -> Tuple[np.ndarray, None]:
+    """Stand-in for model.predict: pick the highest legal index of each mask."""
+    if action_masks.ndim == 1:
+        return np.array(np.flatnonzero(action_masks)[-1]), None
+    return np.array([np.flatnonzero(mask)[-1] for mask in action_masks]), None
+
+
+class TestBatchedRLAIPlayer(unittest.TestCase):
+    player: BatchedRLAIPlayer
+    model: MagicMock
+    states: List[Tuple[GameState, List[Action]]]
+
+    def setUp(self) -> None:
+        self.model = MagicMock()
+        self.model.predict.side_effect = _last_legal_index
+        with patch.object(RLAIPlayer, "_load_model", return_value=self.model):
+            self.player = BatchedRLAIPlayer(max_wait=0.05)
+        self.states = []
+        while len(self.states) < 4:
+            game_state = Game(input_mode="api").game_state
+            legal_actions = game_state.get_legal_actions()
+            if len(legal_actions) > 1:
+                self.states.append((game_state, legal_actions))
+
+    def _gather(self) -> List[Action]:
+        async def run() -> List[Action]:
+            return list(
+                await asyncio.gather(
+                    *(self.player.get_action(gs, legal) for gs, legal in self.states)
+                )
+            )
+
+        return asyncio.run(run())
+
+    def test_batched_actions_match_unbatched(self) -> None:
+        actions = self._gather()
+        expected = [self.player._get_action_core(gs, legal) for gs, legal in self.states]
+        for action, expected_action in zip(actions, expected):
+            self.assertIs(action, expected_action)
+        # The concurrent requests shared one forward pass
+        batch_sizes = [
+            call.args[0].shape[0]
+            for call in self.model.predict.call_args_list
+            if call.args[0].ndim == 2
+        ]
+        self.assertIn(len(self.states), batch_sizes)
+
+    def test_failed_prediction_falls_back_to_first_legal_action(self) -> None:
+        self.model.predict.side_effect = RuntimeError("boom")
+        actions = self._gather()
+        for action, (_, legal_actions) in zip(actions, self.states):
+            self.assertIs(action, legal_actions[0])
+
+    def test_failed_encoding_falls_back_to_first_legal_action(self) -> None:
+        with patch.object(
+            self.player, "_encode_game_state", side_effect=ValueError("bad state")
+        ):
+            actions = self._gather()
+        for action, (_, legal_actions) in zip(actions, self.states):
+            self.assertIs(action, legal_actions[0])
+        self.model.predict.assert_not_called()
+
+    def test_encoding_does_not_wait_for_prediction(self) -> None:
+        predicting = threading.Event()
+        release = threading.Event()
+
+        def blocking_predict(
+            observations: np.ndarray, action_masks: np.ndarray, **kwargs: object
+        ) -> Tuple[np.ndarray, None]:
+            predicting.set()
+            release.wait(5)
+            return _last_legal_index(observations, action_masks, **kwargs)
+
+        self.model.predict.side_effect = blocking_predict
+
+        async def run() -> float:
+            game_state, legal_actions = self.states[0]
+            pending = asyncio.ensure_future(self.player.get_action(game_state, legal_actions))
+            self.assertTrue(await asyncio.to_thread(predicting.wait, 5))
+            start = time.monotonic()
+            self.player._encode_game_state(self.states[1][0])
+            elapsed = time.monotonic() - start
+            release.set()
+            await pending
+            return elapsed
+
+        self.assertLess(asyncio.run(run()), 1)
+
+    def test_worker_restarts_on_new_event_loop(self) -> None:
+        first = self._gather()
+        first_worker = self.player._worker
+        second = self._gather()
+        self.assertIsNot(self.player._worker, first_worker)
+        self.assertEqual(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()